@@ -14,364 +14,1274 @@ import shutil
 import mimetypes
 from datetime import datetime
 from pathlib import Path
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 import cgi
 import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import hashlib
+import html
+import math
+import random
+import time
+from collections import OrderedDict
+from email.utils import format_datetime
+from xml.sax.saxutils import escape as xml_escape
 
-class BlogAPIHandler(BaseHTTPRequestHandler):
-    def __init__(self, *args, **kwargs):
-        self.project_root = Path(__file__).parent
-        self.articles_dir = self.project_root / 'articles'
-        self.data_dir = self.project_root / 'data'
-        self.images_dir = self.project_root / 'assets' / 'images' / 'articles'
-        
-        # Ensure directories exist
-        for dir_path in [self.articles_dir, self.data_dir, self.images_dir]:
-            dir_path.mkdir(parents=True, exist_ok=True)
-        
-        super().__init__(*args, **kwargs)
-    
-    def do_OPTIONS(self):
-        """Handle CORS preflight requests"""
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
-        self.end_headers()
-    
-    def do_GET(self):
-        """Handle GET requests"""
-        parsed_path = urlparse(self.path)
-        
-        if parsed_path.path.startswith('/api/'):
-            self.route_api_request(parsed_path)
-        else:
-            self.handle_static(parsed_path.path)
+PROJECT_ROOT = Path(__file__).parent
+SLUG_PATTERN = re.compile(r'-?[a-z0-9]+(?:-[a-z0-9]+)*-?')
+# Names shadowed by /api/articles/<name> routes or used by non-article pages
+RESERVED_SLUGS = frozenset({'bulk', 'export', 'create'})
+BULK_IMPORT_MAX_WORKERS = 16
 
-    def route_api_request(self, parsed_path):
-        """Dispatch API routes"""
-        if parsed_path.path == '/api/health':
-            self.handle_health()
-        elif parsed_path.path == '/api/articles':
-            self.handle_get_articles()
-        elif parsed_path.path.startswith('/api/articles/'):
-            slug = parsed_path.path.split('/')[-1]
-            self.handle_get_article(slug)
-        else:
-            self.send_error(404, "Not Found")
+COMMENTS_HEADER_FILE = 'comments.json'
+COMMENTS_LOG_FILE = 'comments.ndjson'
+COMMENTS_PAGE_SIZE = 20
+COMMENTS_MAX_PAGE_SIZE = 100
 
-    def handle_static(self, url_path):
-        """Serve static files for the blog UI so port 1978 mirrors the site"""
-        relative_path = url_path.lstrip('/')
-        if not relative_path:
-            relative_path = 'index.html'
-        
-        file_path = (self.project_root / relative_path).resolve()
-        try:
-            project_root_resolved = self.project_root.resolve()
-        except FileNotFoundError:
-            project_root_resolved = self.project_root
-        
-        # Prevent directory traversal
-        if not str(file_path).startswith(str(project_root_resolved)):
-            self.send_error(403, "Forbidden")
+ACCESS_LOG_DIR = PROJECT_ROOT / 'logs'
+ACCESS_LOG_FILE = 'access.log'
+ACCESS_LOG_BUFFER_SIZE = 10000
+ACCESS_LOG_FLUSH_INTERVAL = 1.0  # seconds
+ACCESS_LOG_MAX_BYTES = 10 * 1024 * 1024
+ACCESS_LOG_BACKUPS = 5
+ACCESS_LOG_STATIC_SAMPLE_RATE = 0.1  # fraction of successful static hits recorded
+
+
+class AccessLog:
+    """Non-blocking structured request log
+
+    Request threads push JSON-ready records into a bounded in-memory buffer; a
+    background writer drains it in batches to a size-rotated file. When the
+    buffer is full new records are dropped and counted instead of blocking
+    the request.
+    """
+
+    def __init__(self, log_dir=ACCESS_LOG_DIR, capacity=ACCESS_LOG_BUFFER_SIZE,
+                 static_sample_rate=ACCESS_LOG_STATIC_SAMPLE_RATE):
+        self.log_dir = log_dir
+        self.capacity = capacity
+        self.static_sample_rate = static_sample_rate
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._writer = None
+        self._stop = threading.Event()
+        self.counters = {'written': 0, 'dropped': 0, 'sampledOut': 0}
+
+    def record(self, entry):
+        """Queue a record; never blocks on I/O"""
+        entry.setdefault('ts', time.time())
+        with self._lock:
+            if len(self._buffer) >= self.capacity:
+                self.counters['dropped'] += 1
+                return
+            self._buffer.append(entry)
+
+    def record_request(self, method, route, status, nbytes, latency, client):
+        sampled = not route.startswith('/api/') and status < 400 and self.static_sample_rate < 1
+        if sampled and random.random() >= self.static_sample_rate:
+            with self._lock:
+                self.counters['sampledOut'] += 1
             return
-        
-        if not file_path.exists() or file_path.is_dir():
-            self.send_error(404, "Not Found")
+        entry = {
+            'type': 'access',
+            'method': method,
+            'route': route,
+            'status': status,
+            'bytes': nbytes,
+            'latencyMs': round(latency * 1000, 2),
+            'client': client
+        }
+        if sampled:
+            entry['sampleRate'] = self.static_sample_rate
+        self.record(entry)
+
+    def start(self):
+        if self._writer is None:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            self._writer = threading.Thread(target=self._run_writer, name='access-log-writer', daemon=True)
+            self._writer.start()
+
+    def _run_writer(self):
+        while not self._stop.wait(ACCESS_LOG_FLUSH_INTERVAL):
+            self.flush()
+        self.flush()
+
+    def _rotate(self, path):
+        for i in range(ACCESS_LOG_BACKUPS - 1, 0, -1):
+            older = path.with_name(f'{path.name}.{i}')
+            if older.exists():
+                os.replace(older, path.with_name(f'{path.name}.{i + 1}'))
+        os.replace(path, path.with_name(f'{path.name}.1'))
+
+    def flush(self):
+        """Write buffered records as JSON lines, rotating the file by size"""
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        if not batch:
             return
         
-        content_type, _ = mimetypes.guess_type(str(file_path))
-        if not content_type:
-            content_type = 'application/octet-stream'
+        lines = []
+        for entry in batch:
+            entry['ts'] = datetime.fromtimestamp(entry['ts']).isoformat(timespec='milliseconds')
+            lines.append(json.dumps(entry, ensure_ascii=False, default=str))
         
+        path = self.log_dir / ACCESS_LOG_FILE
         try:
-            with open(file_path, 'rb') as fp:
-                data = fp.read()
-        except Exception as exc:
-            print(f"Error reading {file_path}: {exc}")
-            self.send_error(500, "Failed to read file")
-            return
+            if path.exists() and path.stat().st_size >= ACCESS_LOG_MAX_BYTES:
+                self._rotate(path)
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+            with self._lock:
+                self.counters['written'] += len(batch)
+        except OSError as e:
+            with self._lock:
+                self.counters['dropped'] += len(batch)
+            print(f"Error writing access log: {e}", file=sys.stderr)
+
+    @property
+    def running(self):
+        return self._writer is not None and not self._stop.is_set()
+
+    def close(self):
+        self._stop.set()
+        if self._writer is not None:
+            self._writer.join()
+        self.flush()
+
+    def snapshot(self):
+        with self._lock:
+            return {**self.counters, 'buffered': len(self._buffer)}
+
+
+access_log = AccessLog()
+
+
+def log_event(message, level='info', **fields):
+    """Record an application event alongside the access log
+
+    Without a running writer (CLI tools, build modes) events go to stderr
+    instead, since nothing would ever flush the buffer.
+    """
+    if not access_log.running:
+        details = ''.join(f' {name}={value}' for name, value in fields.items())
+        print(f"[{level}] {message}{details}", file=sys.stderr)
+        return
+    access_log.record({'type': 'event', 'level': level, 'message': message, **fields})
+
+
+class _CountingWriter:
+    """Wrap a socket writer to count response bytes"""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self.bytes_written = 0
+
+    def write(self, data):
+        self.bytes_written += len(data)
+        return self._raw.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+
+def write_bytes_atomic(path, data):
+    """Write bytes to a temp file and swap it into place
+
+    Readers never see a half-written file. The temp name is unique per call
+    so concurrent writers of the same path don't clobber each other's temp.
+    """
+    tmp_path = path.with_name(f'.{path.name}.{uuid.uuid4().hex}.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_text_atomic(path, text):
+    """Write text to a temp file and swap it into place"""
+    write_bytes_atomic(path, text.encode('utf-8'))
+
+
+def write_json_atomic(path, data, indent=2):
+    """Write JSON to a temp file and swap it into place"""
+    if indent is None:
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    else:
+        text = json.dumps(data, indent=indent, ensure_ascii=False)
+    write_text_atomic(path, text)
+
+
+def append_ndjson(path, records):
+    """Append records as JSON lines
+
+    A torn last line left by a crash mid-append is terminated first, so it
+    stays one bad line instead of swallowing the next record. If this write
+    fails, its own partial output is truncated away before re-raising.
+    """
+    data = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records).encode('utf-8')
+    with open(path, 'ab+') as f:
+        end = f.seek(0, os.SEEK_END)
+        if end:
+            f.seek(end - 1)
+            if f.read(1) != b'\n':
+                data = b'\n' + data
+        try:
+            f.write(data)
+            f.flush()
+        except OSError:
+            f.truncate(end)
+            raise
+
+
+def parse_ndjson_line(line, path):
+    """Decode one NDJSON line, or log and return None for a blank or damaged one"""
+    if not line.strip():
+        return None
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        log_event(f"Skipping bad record in {path}: {e}", level='warning')
+        return None
+
+
+class CommentStore:
+    """Append-only per-article comment storage
+
+    Each article keeps its comments as NDJSON in comments.ndjson (one record per
+    line, so posting a comment is a single append) while comments.json remains a
+    small header holding stats and moderation settings. Counts are cached in
+    memory so stats.comments never requires scanning the log.
+    """
+
+    def __init__(self, articles_dir):
+        self.articles_dir = articles_dir
+        self._lock = threading.Lock()
+        self._slug_locks = {}
+        self._headers = {}
+
+    def _slug_lock(self, slug):
+        with self._lock:
+            lock = self._slug_locks.get(slug)
+            if lock is None:
+                lock = self._slug_locks[slug] = threading.Lock()
+            return lock
+
+    def default_header(self, slug):
+        """Header written for a freshly created article"""
+        return {
+            'articleId': slug,
+            'comments': [],
+            'stats': {
+                'totalComments': 0,
+                'totalReplies': 0,
+                'lastComment': None
+            },
+            'moderation': {
+                'allowAnonymous': True,
+                'requireApproval': False,
+                'maxLength': 1000
+            }
+        }
+
+    def _load_header(self, slug):
+        """Load (and cache) the header, migrating any legacy inline comments"""
+        header = self._headers.get(slug)
+        if header is not None:
+            return header
         
-        self.send_response(200)
-        self.send_header('Content-Type', content_type)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Content-Length', str(len(data)))
-        self.end_headers()
-        if self.command != 'HEAD':
-            self.wfile.write(data)
-    
-    def do_POST(self):
-        """Handle POST requests"""
-        parsed_path = urlparse(self.path)
+        article_dir = self.articles_dir / slug
+        header_path = article_dir / COMMENTS_HEADER_FILE
+        log_path = article_dir / COMMENTS_LOG_FILE
         
-        if parsed_path.path == '/api/create-article':
-            self.handle_create_article()
-        elif parsed_path.path.startswith('/api/articles/') and parsed_path.path.endswith('/stats'):
-            slug = parsed_path.path.split('/')[-2]
-            self.handle_update_stats(slug)
-        else:
-            self.send_error(404, "Not Found")
-    
-    def handle_health(self):
-        """Health check endpoint"""
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
+        header = self.default_header(slug)
+        bare_list = False
+        if header_path.exists():
+            try:
+                with open(header_path, 'r', encoding='utf-8') as f:
+                    stored = json.load(f)
+                if isinstance(stored, list):
+                    # The oldest files are just the comment list, with no header
+                    header['comments'] = stored
+                    bare_list = True
+                else:
+                    header.update({k: v for k, v in stored.items() if k in header})
+            except Exception as e:
+                log_event(f"Error reading {header_path}: {e}", level='error')
         
-        response = {
-            'status': 'OK',
-            'message': 'Kerv Talks-Data Blog API is running',
-            'timestamp': datetime.now().isoformat()
-        }
-        self.wfile.write(json.dumps(response).encode())
-    
-    def handle_get_articles(self):
-        """Get all articles"""
-        try:
-            articles_file = self.data_dir / 'articles.json'
-            if articles_file.exists():
-                with open(articles_file, 'r', encoding='utf-8') as f:
-                    articles_data = json.load(f)
-            else:
-                articles_data = {'articles': []}
-            
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(articles_data).encode())
+        # Older comments.json files stored the whole thread inline
+        legacy = header.get('comments') or []
+        if legacy or bare_list:
+            append_ndjson(log_path, legacy)
+            header['comments'] = []
+            header['stats']['totalComments'] = max(header['stats'].get('totalComments', 0), len(legacy))
+            write_json_atomic(header_path, header)
+        
+        self._headers[slug] = header
+        return header
+
+    def count(self, slug):
+        """Cached comment count for an article"""
+        with self._slug_lock(slug):
+            return self._load_header(slug)['stats']['totalComments']
+
+    def header(self, slug):
+        with self._slug_lock(slug):
+            return json.loads(json.dumps(self._load_header(slug)))
+
+    def append(self, slug, author, content, parent_id=None):
+        """Append a comment and refresh the header stats"""
+        with self._slug_lock(slug):
+            header = self._load_header(slug)
+            now = datetime.now().isoformat()
+            comment = {
+                'id': uuid.uuid4().hex,
+                'articleId': slug,
+                'parentId': parent_id,
+                'author': author,
+                'content': content,
+                'created': now,
+                'approved': not header['moderation'].get('requireApproval', False)
+            }
             
-        except Exception as e:
-            self.send_error(500, f"Error reading articles: {str(e)}")
-    
-    def handle_get_article(self, slug):
-        """Get specific article"""
-        try:
             article_dir = self.articles_dir / slug
-            metadata_file = article_dir / 'metadata.json'
+            append_ndjson(article_dir / COMMENTS_LOG_FILE, [comment])
             
-            if metadata_file.exists():
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
-                
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps(metadata).encode())
-            else:
-                self.send_error(404, "Article not found")
-                
-        except Exception as e:
-            self.send_error(500, f"Error reading article: {str(e)}")
-    
-    def handle_create_article(self):
-        """Create new article"""
-        try:
-            # Parse multipart form data
-            content_type = self.headers.get('Content-Type', '')
-            if not content_type.startswith('multipart/form-data'):
-                self.send_error(400, "Content-Type must be multipart/form-data")
+            stats = header['stats']
+            stats['totalComments'] = stats.get('totalComments', 0) + 1
+            if parent_id:
+                stats['totalReplies'] = stats.get('totalReplies', 0) + 1
+            stats['lastComment'] = now
+            write_json_atomic(article_dir / COMMENTS_HEADER_FILE, header)
+            return comment
+
+    def page(self, slug, cursor=0, limit=COMMENTS_PAGE_SIZE):
+        """Read up to ``limit`` comments starting at byte offset ``cursor``
+
+        Returns the comments and the cursor for the next page (None at the end).
+        """
+        with self._slug_lock(slug):
+            self._load_header(slug)
+        
+        log_path = self.articles_dir / slug / COMMENTS_LOG_FILE
+        if not log_path.exists():
+            return [], None
+        
+        comments = []
+        with open(log_path, 'rb') as f:
+            if cursor:
+                # Cursors must point at the start of a record
+                f.seek(cursor - 1)
+                if f.read(1) != b'\n':
+                    raise ValueError('Invalid cursor')
+            while len(comments) < limit:
+                line = f.readline()
+                if not line.endswith(b'\n'):
+                    # EOF, or a record still being appended
+                    break
+                cursor += len(line)
+                # Damaged records are skipped, never reported as a bad cursor
+                comment = parse_ndjson_line(line, log_path)
+                if isinstance(comment, dict):
+                    comments.append(comment)
+            has_more = bool(f.readline().strip())
+        return comments, (cursor if has_more else None)
+
+
+comment_store = CommentStore(PROJECT_ROOT / 'articles')
+
+NEWSLETTER_HEADER_FILE = 'newsletter.json'
+NEWSLETTER_LOG_FILE = 'newsletter.ndjson'
+NEWSLETTER_BATCH_SIZE = 200
+NEWSLETTER_FLUSH_INTERVAL = 0.5  # seconds
+EMAIL_PATTERN = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+$')
+
+
+def normalize_email(email):
+    """Canonical form used for subscriber dedup"""
+    return (email or '').strip().lower()
+
+
+class NewsletterStore:
+    """Deduplicated, batch-appended newsletter subscriber store
+
+    Subscriptions are appended to data/newsletter.ndjson in batches by a
+    background writer; data/newsletter.json keeps only the stats header. A hash
+    index of normalized emails is held in memory so duplicate signups are
+    rejected without touching disk.
+    """
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._emails = set()
+        self._pending = []
+        self._stats = None
+        self._writer = None
+        self._closed = False
+
+    def default_header(self):
+        return {
+            'subscriptions': [],
+            'stats': {
+                'totalSubscribers': 0,
+                'activeSubscribers': 0,
+                'lastSubscription': None
+            }
+        }
+
+    def load(self):
+        """Build the email index from disk, migrating legacy inline subscriptions"""
+        with self._cond:
+            if self._stats is not None:
                 return
             
-            # Parse form data
-            form = cgi.FieldStorage(
-                fp=self.rfile,
-                headers=self.headers,
-                environ={'REQUEST_METHOD': 'POST'}
-            )
-            
-            # Extract form fields
-            title = form.getvalue('title', '').strip()
-            excerpt = form.getvalue('excerpt', '').strip()
-            category = form.getvalue('category', '').strip()
-            author = form.getvalue('author', 'data-crusader').strip()
-            tags = form.getvalue('tags', '').strip()
-            content = form.getvalue('content', '').strip()
-            featured = form.getvalue('featured', 'false').strip()
-            comments = form.getvalue('comments', 'true').strip()
-            notification = form.getvalue('notification', 'false').strip()
+            header_path = self.data_dir / NEWSLETTER_HEADER_FILE
+            log_path = self.data_dir / NEWSLETTER_LOG_FILE
+            header = self.default_header()
+            if header_path.exists():
+                try:
+                    with open(header_path, 'r', encoding='utf-8') as f:
+                        stored = json.load(f)
+                    header.update({k: v for k, v in stored.items() if k in header})
+                except Exception as e:
+                    log_event(f"Error reading {header_path}: {e}", level='error')
             
-            # Validate required fields
-            if not title or not category or not content:
-                self.send_error(400, "Missing required fields: title, category, and content are required")
-                return
+            if log_path.exists():
+                with open(log_path, 'rb') as f:
+                    for line in f:
+                        subscription = parse_ndjson_line(line, log_path)
+                        if isinstance(subscription, dict):
+                            self._emails.add(normalize_email(subscription.get('email')))
             
-            # Generate slug
-            slug = self.generate_slug(title)
-            article_id = slug
-            
-            # Get author info
-            author_info = self.get_author_info(author)
-            
-            # Create article data
-            article_data = {
-                'id': article_id,
-                'slug': slug,
-                'title': title,
-                'excerpt': excerpt,
-                'author': author_info,
-                'published': datetime.now().isoformat(),
-                'updated': datetime.now().isoformat(),
-                'status': 'published',
-                'readTime': self.calculate_reading_time(content),
-                'category': category,
-                'tags': [tag.strip() for tag in tags.split(',') if tag.strip()] if tags else [],
-                'image': {
-                    'featured': None,
-                    'alt': f'{title} featured image'
-                },
-                'stats': {
-                    'views': 0,
-                    'likes': 0,
-                    'comments': 0,
-                    'shares': 0
-                },
-                'seo': {
-                    'metaTitle': f'{title} - Kerv Talks-Data Blog',
-                    'metaDescription': excerpt or '',
-                    'keywords': [tag.strip() for tag in tags.split(',') if tag.strip()] if tags else [],
-                    'canonical': f'https://kervtalksdata.com/articles/{slug}/'
-                },
-                'settings': {
-                    'featured': featured == 'true',
-                    'allowComments': comments == 'true',
-                    'notifySubscribers': notification == 'true',
-                    'archived': False
-                },
-            'content': content  # Store the actual content
-            }
+            legacy = header.get('subscriptions') or []
+            if legacy:
+                migrated = []
+                for subscription in legacy:
+                    email = normalize_email(subscription.get('email'))
+                    if email and email not in self._emails:
+                        self._emails.add(email)
+                        migrated.append(subscription)
+                append_ndjson(log_path, migrated)
+                header['subscriptions'] = []
             
-            # Handle image upload
-            if 'featuredImage' in form:
-                image_file = form['featuredImage']
-                if image_file.filename:
-                    # Save image
-                    image_ext = os.path.splitext(image_file.filename)[1]
-                    image_filename = f'{slug}{image_ext}'
-                    image_path = self.images_dir / image_filename
-                    
-                    with open(image_path, 'wb') as f:
-                        f.write(image_file.file.read())
-                    
-                    article_data['image']['featured'] = image_filename
-                    print(f"🖼️  Image uploaded: {image_filename}")
+            stats = header['stats']
+            stats['totalSubscribers'] = max(stats.get('totalSubscribers', 0), len(self._emails))
+            stats['activeSubscribers'] = max(stats.get('activeSubscribers', 0), len(self._emails))
+            self._stats = stats
+            if legacy:
+                write_json_atomic(header_path, header)
+
+    def subscribe(self, email, **fields):
+        """Queue a subscription; returns (subscription, created)"""
+        self.load()
+        email = normalize_email(email)
+        with self._cond:
+            if email in self._emails:
+                return {'email': email, 'status': 'active'}, False
             
-            # Create article directory
-            article_dir = self.articles_dir / slug
-            article_dir.mkdir(parents=True, exist_ok=True)
-            print(f"📁 Created directory: articles/{slug}/")
-            
-            # Create article HTML file
-            article_html = self.generate_article_html(article_data)
-            index_path = article_dir / 'index.html'
-            with open(index_path, 'w', encoding='utf-8') as f:
-                f.write(article_html)
-            print(f"📄 Created: articles/{slug}/index.html")
-            
-            # Create metadata.json
-            metadata_path = article_dir / 'metadata.json'
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(article_data, f, indent=2, ensure_ascii=False)
-            print(f"📄 Created: articles/{slug}/metadata.json")
-            
-            # Create comments.json
-            comments_path = article_dir / 'comments.json'
-            comments_data = {
-                'articleId': slug,
-                'comments': [],
-                'stats': {
-                    'totalComments': 0,
-                    'totalReplies': 0,
-                    'lastComment': None
-                },
-                'moderation': {
-                    'allowAnonymous': True,
-                    'requireApproval': False,
-                    'maxLength': 1000
-                }
+            now = datetime.now().isoformat()
+            subscription = {
+                'id': f'sub_{uuid.uuid4().hex[:16]}',
+                'email': email,
+                'subscriptionDate': now,
+                'status': 'active',
+                **fields
             }
-            with open(comments_path, 'w', encoding='utf-8') as f:
-                json.dump(comments_data, f, indent=2, ensure_ascii=False)
-            print(f"📄 Created: articles/{slug}/comments.json")
-            
-            # Update articles.json
-            self.update_articles_json(article_data)
-            print(f"📝 Updated: data/articles.json")
+            self._emails.add(email)
+            self._pending.append(subscription)
+            self._stats['totalSubscribers'] += 1
+            self._stats['activeSubscribers'] += 1
+            self._stats['lastSubscription'] = now
             
-            print(f"✅ Article '{slug}' created successfully!")
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run_writer, name='newsletter-writer', daemon=True)
+                self._writer.start()
+            if len(self._pending) >= NEWSLETTER_BATCH_SIZE:
+                self._cond.notify()
+            return subscription, True
+
+    def stats(self):
+        self.load()
+        with self._cond:
+            return dict(self._stats)
+
+    def _run_writer(self):
+        failed = False
+        while True:
+            with self._cond:
+                if failed or (len(self._pending) < NEWSLETTER_BATCH_SIZE and not self._closed):
+                    self._cond.wait(NEWSLETTER_FLUSH_INTERVAL)
+                if self._closed and (failed or not self._pending):
+                    # close() makes one last attempt for anything still queued
+                    return
+            failed = not self.flush()
+
+    def flush(self):
+        """Append queued subscriptions and rewrite the stats header once
+
+        Returns False if the batch could not be written; it is put back at the
+        front of the queue so the next flush retries it.
+        """
+        with self._flush_lock:
+            with self._cond:
+                batch, self._pending = self._pending, []
+                stats = dict(self._stats) if self._stats is not None else None
+            if not batch:
+                return True
             
-            # Send success response
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
+            log_path = self.data_dir / NEWSLETTER_LOG_FILE
+            try:
+                append_ndjson(log_path, batch)
+            except OSError as e:
+                with self._cond:
+                    self._pending[:0] = batch
+                log_event(f"Error writing {log_path}: {e}", level='error', pending=len(batch))
+                return False
             
-            response = {
-                'success': True,
-                'message': 'Article created successfully!',
-                'article': {
-                    'id': article_data['id'],
-                    'slug': article_data['slug'],
-                    'title': article_data['title'],
-                    'url': f'http://localhost:1977/articles/{slug}/'
-                }
-            }
-            self.wfile.write(json.dumps(response).encode())
+            try:
+                write_json_atomic(self.data_dir / NEWSLETTER_HEADER_FILE, {'subscriptions': [], 'stats': stats})
+            except OSError as e:
+                # The log is authoritative; the stats header is rewritten on the next flush
+                log_event(f"Error writing newsletter stats: {e}", level='error')
+            return True
+
+    def close(self):
+        """Stop the background writer after draining the queue"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            writer = self._writer
+        if writer is not None:
+            writer.join()
+        self.flush()
+
+
+newsletter_store = NewsletterStore(PROJECT_ROOT / 'data')
+
+SITE_URL = 'https://kervtalksdata.com'
+SITE_TITLE = 'Kerv Talks-Data Blog'
+SITE_DESCRIPTION = 'Insights on data architecture, analytics and information asymmetry'
+FEED_ITEM_LIMIT = 20
+SITEMAP_STATIC_PAGES = ['', 'articles/', 'about.html', 'contact.html']
+
+# Summary fields that appear in feeds; stat counters deliberately excluded
+FEED_FIELDS = ('id', 'title', 'excerpt', 'author', 'published', 'category', 'tags', 'image')
+
+
+def _published_datetime(article):
+    """Parse an articles.json ``published`` value (date or ISO datetime)"""
+    try:
+        return datetime.fromisoformat(str(article.get('published', '')).split('T')[0])
+    except ValueError:
+        return datetime(1970, 1, 1)
+
+
+def _article_url(article):
+    return f"{SITE_URL}/articles/{article['id']}/"
+
+
+def render_rss(articles):
+    """Render an RSS 2.0 feed for the newest articles"""
+    items = []
+    for article in articles[:FEED_ITEM_LIMIT]:
+        url = _article_url(article)
+        categories = ''.join(
+            f'<category>{xml_escape(str(tag))}</category>' for tag in [article.get('category')] + list(article.get('tags') or []) if tag
+        )
+        items.append(
+            '<item>'
+            f"<title>{xml_escape(article.get('title', '').strip())}</title>"
+            f'<link>{url}</link>'
+            f'<guid isPermaLink="true">{url}</guid>'
+            f"<pubDate>{format_datetime(_published_datetime(article))}</pubDate>"
+            f"<description>{xml_escape(article.get('excerpt') or '')}</description>"
+            f'{categories}'
+            '</item>'
+        )
+    last_build = format_datetime(_published_datetime(articles[0])) if articles else ''
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom"><channel>'
+        f'<title>{xml_escape(SITE_TITLE)}</title>'
+        f'<link>{SITE_URL}/</link>'
+        f'<description>{xml_escape(SITE_DESCRIPTION)}</description>'
+        f'<atom:link href="{SITE_URL}/feed.xml" rel="self" type="application/rss+xml"/>'
+        f'<lastBuildDate>{last_build}</lastBuildDate>'
+        f"{''.join(items)}"
+        '</channel></rss>\n'
+    ).encode('utf-8')
+
+
+def render_atom(articles):
+    """Render an Atom 1.0 feed for the newest articles"""
+    entries = []
+    for article in articles[:FEED_ITEM_LIMIT]:
+        url = _article_url(article)
+        published = _published_datetime(article).strftime('%Y-%m-%dT%H:%M:%SZ')
+        author = (article.get('author') or {}).get('name', SITE_TITLE)
+        entries.append(
+            '<entry>'
+            f"<title>{xml_escape(article.get('title', '').strip())}</title>"
+            f'<link href="{url}"/>'
+            f'<id>{url}</id>'
+            f'<published>{published}</published>'
+            f'<updated>{published}</updated>'
+            f'<author><name>{xml_escape(author)}</name></author>'
+            f"<summary>{xml_escape(article.get('excerpt') or '')}</summary>"
+            '</entry>'
+        )
+    updated = _published_datetime(articles[0]).strftime('%Y-%m-%dT%H:%M:%SZ') if articles else '1970-01-01T00:00:00Z'
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom">'
+        f'<title>{xml_escape(SITE_TITLE)}</title>'
+        f'<subtitle>{xml_escape(SITE_DESCRIPTION)}</subtitle>'
+        f'<link href="{SITE_URL}/"/>'
+        f'<link href="{SITE_URL}/atom.xml" rel="self"/>'
+        f'<id>{SITE_URL}/</id>'
+        f'<updated>{updated}</updated>'
+        f"{''.join(entries)}"
+        '</feed>\n'
+    ).encode('utf-8')
+
+
+def render_sitemap(articles):
+    """Render sitemap.xml covering the static pages and every article"""
+    urls = [f'<url><loc>{SITE_URL}/{page}</loc></url>' for page in SITEMAP_STATIC_PAGES]
+    if (PROJECT_ROOT / LISTING_DIR_NAME / 'index.html').exists():
+        # Only advertise the prerendered listing once it has been built
+        urls.append(f'<url><loc>{SITE_URL}/{LISTING_DIR_NAME}/</loc></url>')
+    for article in articles:
+        lastmod = _published_datetime(article).strftime('%Y-%m-%d')
+        urls.append(f'<url><loc>{_article_url(article)}</loc><lastmod>{lastmod}</lastmod></url>')
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        f"{''.join(urls)}"
+        '</urlset>\n'
+    ).encode('utf-8')
+
+
+FEED_RENDERERS = {
+    'feed.xml': ('application/rss+xml; charset=utf-8', render_rss),
+    'atom.xml': ('application/atom+xml; charset=utf-8', render_atom),
+    'sitemap.xml': ('application/xml; charset=utf-8', render_sitemap),
+}
+
+
+class FeedCache:
+    """Rendered feed/sitemap bytes kept in memory until the published set changes"""
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def _load_articles(self):
+        articles_file = self.data_dir / 'articles.json'
+        if not articles_file.exists():
+            return []
+        with open(articles_file, 'r', encoding='utf-8') as f:
+            articles = json.load(f).get('articles', [])
+        return sorted(articles, key=_published_datetime, reverse=True)
+
+    def render(self, name):
+        """Render a feed from articles.json, bypassing the cache"""
+        content_type, renderer = FEED_RENDERERS[name]
+        body = renderer(self._load_articles())
+        return body, f'"{hashlib.sha1(body).hexdigest()}"', content_type
+
+    def get(self, name):
+        """Return (body, etag, content_type) for a feed name"""
+        if not self.enabled:
+            return self.render(name)
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                entry = self._entries[name] = self.render(name)
+            return entry
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+
+    def write(self, output_dir):
+        """Write every feed to ``output_dir`` for static hosting"""
+        written = []
+        for name in FEED_RENDERERS:
+            body, _, _ = self.render(name)
+            path = Path(output_dir) / name
+            write_bytes_atomic(path, body)
+            written.append(path)
+        return written
+
+
+feed_cache = FeedCache(PROJECT_ROOT / 'data')
+
+
+def etag_matches(if_none_match, etag):
+    """Weak If-None-Match comparison: any listed tag, W/ or not, or ``*``"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in candidates or etag.removeprefix('W/') in (tag.removeprefix('W/') for tag in candidates)
+
+# (requests per second, burst) per client IP and across all clients
+ADMISSION_LIMITS = {
+    'create': {'per_client': (0.2, 5), 'global': (2, 20)},
+    'stats': {'per_client': (2, 10), 'global': (100, 200)},
+    'write': {'per_client': (1, 10), 'global': (100, 500)},
+    'read': {'per_client': (50, 200), 'global': (2000, 4000)},
+}
+ADMISSION_MAX_IN_FLIGHT = 64
+ADMISSION_MAX_BUCKETS = 10000
+
+
+def route_class(method, path):
+    """Group a request into the admission class used for rate limiting"""
+    if method != 'POST':
+        return 'read'
+    if path in ('/api/create-article', '/api/articles/bulk'):
+        return 'create'
+    if path.endswith('/stats'):
+        return 'stats'
+    return 'write'
+
+
+class TokenBucket:
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated')
+
+    def __init__(self, rate, capacity, now):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def take(self, now):
+        """Consume a token; returns 0 on success or the seconds until one is available"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+
+class AdmissionController:
+    """Token-bucket rate limiting and in-flight load shedding
+
+    Buckets are kept per (client, route class), in an LRU table capped at
+    ``max_buckets`` so memory stays bounded regardless of how many clients
+    show up, and per route class across all clients in a separate table that
+    is never evicted.
+    """
+
+    def __init__(self, limits=ADMISSION_LIMITS, max_in_flight=ADMISSION_MAX_IN_FLIGHT, max_buckets=ADMISSION_MAX_BUCKETS):
+        self.limits = limits
+        self.max_in_flight = max_in_flight
+        self.max_buckets = max_buckets
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict()
+        self._global_buckets = {}
+        self._in_flight = 0
+        self.counters = {'admitted': 0, 'rateLimited': 0, 'overloaded': 0, 'evictedBuckets': 0}
+
+    def _bucket(self, key, rate, capacity, now):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(rate, capacity, now)
+            if len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+                self.counters['evictedBuckets'] += 1
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+    def admit(self, client, method, path):
+        """Return (status, retry_after): status 200 admits, 429/503 sheds
+
+        Every admitted request must be paired with a call to ``release``.
+        """
+        if not self.enabled:
+            return 200, 0
+        
+        name = route_class(method, path)
+        limits = self.limits.get(name, {})
+        now = time.monotonic()
+        with self._lock:
+            if self._in_flight >= self.max_in_flight:
+                self.counters['overloaded'] += 1
+                return 503, 1
             
-        except Exception as e:
-            print(f"❌ Error creating article: {str(e)}")
-            self.send_error(500, f"Failed to create article: {str(e)}")
+            retry_after = 0
+            if 'per_client' in limits:
+                rate, capacity = limits['per_client']
+                retry_after = self._bucket((client, name), rate, capacity, now).take(now)
+            if not retry_after and 'global' in limits:
+                bucket = self._global_buckets.get(name)
+                if bucket is None:
+                    rate, capacity = limits['global']
+                    bucket = self._global_buckets[name] = TokenBucket(rate, capacity, now)
+                retry_after = bucket.take(now)
+            if retry_after:
+                self.counters['rateLimited'] += 1
+                return 429, max(1, math.ceil(retry_after))
+            
+            self._in_flight += 1
+            self.counters['admitted'] += 1
+            return 200, 0
+
+    def release(self):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+
+    def snapshot(self):
+        with self._lock:
+            return {**self.counters, 'inFlight': self._in_flight, 'buckets': len(self._buckets)}
+
+
+admission = AdmissionController()
+
+# Serializes read-modify-write cycles on articles.json and metadata.json
+articles_index_lock = threading.RLock()
+
+ASSETS_DIR = PROJECT_ROOT / 'assets'
+ASSET_DIST_DIR = ASSETS_DIR / 'dist'
+ASSET_MANIFEST_FILE = 'manifest.json'
+ASSET_SOURCE_DIRS = ('css', 'js')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Logical asset names (relative to assets/) used by generated article pages
+ARTICLE_STYLESHEETS = ('article.bundle.css', ['css/main.css', 'css/responsive.css'])
+ARTICLE_SCRIPTS = ('article.bundle.js', ['js/config.js', 'js/main.js', 'js/article.js', 'js/newsletter.js', 'js/analytics.js'])
+
+
+def minify_css(source):
+    """Conservative CSS minifier: drop comments and collapse whitespace"""
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r'\s*([{};,>])\s*', r'\1', source)
+    source = re.sub(r';}', '}', source)
+    return source.strip() + '\n'
+
+
+def _write_fingerprinted(dist_dir, logical_name, data):
+    """Write ``data`` under ``dist_dir`` with a content hash in its name"""
+    digest = hashlib.sha256(data).hexdigest()[:10]
+    stem, ext = os.path.splitext(logical_name)
+    fingerprinted = f'{stem}.{digest}{ext}'
+    path = dist_dir / fingerprinted
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Also repairs a file truncated by an older, interrupted build
+    if not path.exists() or hashlib.sha256(path.read_bytes()).hexdigest()[:10] != digest:
+        write_bytes_atomic(path, data)
+    return fingerprinted
+
+
+def build_assets(minify=False, bundle=False, assets_dir=ASSETS_DIR, dist_dir=ASSET_DIST_DIR):
+    """Fingerprint assets/css and assets/js into assets/dist and write the manifest
+
+    With ``minify`` CSS is minified (JS is left as-is: a regex minifier cannot
+    safely handle template literals). With ``bundle`` the article page's
+    stylesheets and scripts are also concatenated into one file each.
+
+    Superseded fingerprinted files are kept: article and listing pages
+    rendered earlier still reference them and are not re-rendered here.
+    """
+    manifest = {'files': {}, 'bundles': {}}
+    sources = {}
+    for kind in ASSET_SOURCE_DIRS:
+        for path in sorted((assets_dir / kind).glob(f'*.{kind}')):
+            logical_name = f'{kind}/{path.name}'
+            data = path.read_bytes()
+            if minify and kind == 'css':
+                data = minify_css(data.decode('utf-8')).encode('utf-8')
+            sources[logical_name] = data
+            manifest['files'][logical_name] = _write_fingerprinted(dist_dir, logical_name, data)
     
-    def handle_update_stats(self, slug):
-        """Update article stats"""
+    if bundle:
+        for bundle_name, members in (ARTICLE_STYLESHEETS, ARTICLE_SCRIPTS):
+            kind = bundle_name.rsplit('.', 1)[1]
+            separator = b'\n' if kind == 'css' else b';\n'
+            data = separator.join(sources[name].rstrip() for name in members) + b'\n'
+            manifest['bundles'][bundle_name] = _write_fingerprinted(dist_dir, f'{kind}/{bundle_name}', data)
+    
+    write_json_atomic(dist_dir / ASSET_MANIFEST_FILE, manifest)
+    asset_manifest.invalidate()
+    return manifest
+
+
+class AssetManifest:
+    """Lazily loaded assets/dist/manifest.json, reloaded when the file changes"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._data = {'files': {}, 'bundles': {}}
+
+    def get(self):
         try:
-            # Read request body
-            content_length = int(self.headers.get('Content-Length', 0))
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
-            
-            stat_type = data.get('type')
-            increment = data.get('increment', 1)
+            mtime = self.path.stat().st_mtime
+        except FileNotFoundError:
+            return {'files': {}, 'bundles': {}}
+        with self._lock:
+            if mtime != self._mtime:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._data = json.load(f)
+                self._mtime = mtime
+            return self._data
+
+    def invalidate(self):
+        with self._lock:
+            self._mtime = None
+
+
+asset_manifest = AssetManifest(ASSET_DIST_DIR / ASSET_MANIFEST_FILE)
+
+LISTING_DIR_NAME = 'listing'
+LISTING_PAGE_SIZE = 6
+LISTING_MANIFEST_FILE = 'manifest.json'
+LISTING_STYLESHEETS = ('listing.bundle.css', ['css/main.css', 'css/responsive.css'])
+LISTING_SCRIPTS = ('listing.bundle.js', ['js/nav.js', 'js/config.js', 'js/analytics.js'])
+
+# Summary fields shown on listing cards (views are not displayed)
+LISTING_CARD_FIELDS = ('id', 'title', 'excerpt', 'author', 'published', 'readTime',
+                       'category', 'tags', 'image', 'likes', 'comments')
+
+RELATED_INDEX_FILE = 'related.json'
+RELATED_MODEL_FILE = 'related-model.npz'
+RELATED_TOP_K = 5
+RELATED_BLOCK_SIZE = 1000
+RELATED_MIN_DF = 2
+RELATED_MAX_DF = 0.5  # drop terms found in more than half the articles
+RELATED_TAG_WEIGHT = 3  # tags and category count as this many term occurrences
+RELATED_STOPWORDS = frozenset("""
+    about after also an and any are because been being but can could did does each for from had has have
+    how into its just like more most not only other our out over same should some such than that the their
+    them then there these they this those through under very was were what when where which while who why
+    will with would you your
+""".split())
+
+
+def related_terms(article):
+    """Bag of terms for an article: HTML-stripped text plus weighted tags and category"""
+    text = ' '.join([article.get('title') or '', article.get('excerpt') or '', article.get('content') or ''])
+    text = html.unescape(re.sub(r'<[^>]*>', ' ', text)).lower()
+    terms = [word for word in re.findall(r'[a-z0-9]{3,}', text) if word not in RELATED_STOPWORDS]
+    labels = [f"tag:{tag}".lower() for tag in article.get('tags') or []]
+    if article.get('category'):
+        labels.append(f"category:{article['category']}".lower())
+    return terms + labels * RELATED_TAG_WEIGHT
+
+
+class RelatedIndex:
+    """Precomputed top-k related articles from TF-IDF cosine similarity
+
+    build() vectorizes every articles/*/metadata.json into a sparse TF-IDF
+    matrix and computes neighbours in row blocks with NumPy/SciPy; add()
+    folds a single new article into the in-memory model without a rebuild.
+    The result is stored compactly in data/related.json as
+    {slug: [[neighbour, score], ...]}, and the model add() extends (vocabulary,
+    document frequencies and the normalized matrix) in data/related-model.npz,
+    so the first add() after a restart does not trigger a full rebuild. NumPy
+    and SciPy are only imported when the index is (re)built or extended, so
+    serving a prebuilt index needs neither.
+    """
+
+    def __init__(self, articles_dir, data_dir, k=RELATED_TOP_K):
+        self.articles_dir = articles_dir
+        self.path = data_dir / RELATED_INDEX_FILE
+        self.model_path = data_dir / RELATED_MODEL_FILE
+        self.k = k
+        self._lock = threading.Lock()
+        self._model = None
+        self._index = None
+        self._mtime = None
+
+    def _read_documents(self):
+        for metadata_file in sorted(self.articles_dir.glob('*/metadata.json')):
+            try:
+                with open(metadata_file, 'r', encoding='utf-8') as f:
+                    article = json.load(f)
+            except Exception as e:
+                log_event(f"Error reading {metadata_file}: {e}", level='error')
+                continue
+            # The directory name is the URL slug, even if metadata disagrees
+            slug = metadata_file.parent.name
+            yield slug, article.get('title', '').strip(), related_terms(article)
+
+    def _vectorize(self, term_lists, vocabulary, df, total):
+        import numpy as np
+        from scipy import sparse
+        
+        idf = np.log((1 + total) / (1 + df)) + 1
+        data, indices, indptr = [], [], [0]
+        for terms in term_lists:
+            counts = {}
+            for term in terms:
+                column = vocabulary.get(term)
+                if column is not None:
+                    counts[column] = counts.get(column, 0) + 1
+            row = sorted(counts)
+            indices.extend(row)
+            data.extend(1 + math.log(counts[column]) for column in row)
+            indptr.append(len(indices))
+        
+        matrix = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float32), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(term_lists), len(vocabulary))
+        )
+        matrix = matrix.multiply(idf.astype(np.float32)).tocsr()
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        return sparse.diags(1 / norms).dot(matrix).tocsr()
+
+    def build(self, documents=None):
+        """Rebuild the whole index; returns the number of articles indexed"""
+        import numpy as np
+        
+        documents = list(documents if documents is not None else self._read_documents())
+        slugs = [slug for slug, _, _ in documents]
+        titles = {slug: title for slug, title, _ in documents}
+        term_lists = [terms for _, _, terms in documents]
+        total = len(documents)
+        
+        document_frequency = {}
+        for terms in term_lists:
+            for term in set(terms):
+                document_frequency[term] = document_frequency.get(term, 0) + 1
+        min_df = RELATED_MIN_DF if total >= 2 * RELATED_MIN_DF else 1
+        vocabulary = {}
+        # Sorted so column order (and float summation order) never depends on the hash seed
+        for term in sorted(document_frequency):
+            count = document_frequency[term]
+            if count >= min_df and (count <= RELATED_MAX_DF * total or term.startswith(('tag:', 'category:'))):
+                vocabulary[term] = len(vocabulary)
+        df = np.zeros(len(vocabulary), dtype=np.float64)
+        for term, column in vocabulary.items():
+            df[column] = document_frequency[term]
+        
+        matrix = self._vectorize(term_lists, vocabulary, df, total)
+        neighbours = {}
+        for start in range(0, total, RELATED_BLOCK_SIZE):
+            block = matrix[start:start + RELATED_BLOCK_SIZE].dot(matrix.T).toarray()
+            rows = np.arange(block.shape[0])
+            block[rows, rows + start] = 0  # an article is not related to itself
+            for row in rows:
+                neighbours[slugs[start + row]] = self._rank(block[row], slugs)
+        
+        with self._lock:
+            self._model = {
+                'slugs': slugs,
+                'positions': {slug: i for i, slug in enumerate(slugs)},
+                'vocabulary': vocabulary,
+                'df': df,
+                'total': total,
+                'matrix': matrix
+            }
+            self._save({'k': self.k, 'titles': titles, 'neighbours': neighbours})
+            self._save_model(self._model)
+        return total
+
+    def _rank(self, scores, slugs):
+        """Top-k [slug, score] pairs with ties broken by slug, so output is deterministic"""
+        import numpy as np
+        
+        k = min(self.k, len(scores))
+        if k <= 0:
+            return []
+        kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+        # Widen the cut slightly so scores that round to the same value all compete
+        candidates = np.nonzero((scores >= kth - 1e-4) & (scores > 0))[0]
+        ranked = sorted(((round(float(scores[column]), 4), slugs[column]) for column in candidates),
+                        key=lambda item: (-item[0], item[1]))
+        return [[slug, score] for score, slug in ranked[:self.k]]
+
+    def warm(self):
+        """Load the saved model, or build one, so the next add() is incremental"""
+        with self._lock:
+            if self._model is None:
+                self._model = self._load_model()
+            ready = self._model is not None
+        if not ready:
+            self.build()
+
+    def add(self, article):
+        """Fold one new article into the index without recomputing every pair
+
+        Existing vectors keep their original IDF weights until the next full
+        build; the new article is scored against all of them in one sparse
+        matrix-vector product. Re-creating an existing slug replaces its row.
+        """
+        import numpy as np
+        from scipy import sparse
+        
+        slug = article.get('slug') or article['id']
+        with self._lock:
+            if self._model is None:
+                self._model = self._load_model()
+            model = self._model
+        if model is None:
+            # Cold start: the full build already includes it
+            self.build()
+            return
+        
+        with self._lock:
+            terms = related_terms(article)
+            position = model['positions'].get(slug)
+            if position is None:
+                model['total'] += 1
+            else:
+                # Retract the old version's document frequencies
+                for column in model['matrix'][position].indices:
+                    model['df'][column] -= 1
+            for term in set(terms):
+                column = model['vocabulary'].get(term)
+                if column is not None:
+                    model['df'][column] += 1
+            vector = self._vectorize([terms], model['vocabulary'], model['df'], model['total'])
+            scores = model['matrix'].dot(vector.T).toarray().ravel()
             
-            if not stat_type:
-                self.send_error(400, "Missing stat type")
-                return
+            index = dict(self._load_locked())
+            neighbours = dict(index.get('neighbours', {}))
+            if position is not None:
+                scores[position] = 0  # an article is not related to itself
+                # Scores against the old version are stale
+                neighbours = {
+                    other: [item for item in items if item[0] != slug] for other, items in neighbours.items()
+                }
+            neighbours[slug] = self._rank(scores, model['slugs'])
             
-            article_dir = self.articles_dir / slug
-            metadata_file = article_dir / 'metadata.json'
+            # The new article may displace the weakest neighbour of existing ones
+            for column in np.nonzero(scores > 0)[0]:
+                other = model['slugs'][column]
+                score = round(float(scores[column]), 4)
+                current = neighbours.get(other, [])
+                if len(current) < self.k or (-score, slug) < (-current[-1][1], current[-1][0]):
+                    neighbours[other] = sorted(current + [[slug, score]], key=lambda item: (-item[1], item[0]))[:self.k]
             
-            if metadata_file.exists():
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
-                
-                if 'stats' in metadata and stat_type in metadata['stats']:
-                    metadata['stats'][stat_type] += increment
-                    metadata['updated'] = datetime.now().isoformat()
-                    
-                    with open(metadata_file, 'w', encoding='utf-8') as f:
-                        json.dump(metadata, f, indent=2, ensure_ascii=False)
-                    
-                    # Also update articles.json
-                    self.update_articles_json(metadata)
-                    
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    
-                    response = {'success': True, 'stats': metadata['stats']}
-                    self.wfile.write(json.dumps(response).encode())
-                else:
-                    self.send_error(400, "Invalid stat type")
+            if position is None:
+                model['slugs'].append(slug)
+                model['positions'][slug] = len(model['slugs']) - 1
+                model['matrix'] = sparse.vstack([model['matrix'], vector]).tocsr()
             else:
-                self.send_error(404, "Article not found")
-                
+                matrix = model['matrix']
+                model['matrix'] = sparse.vstack([matrix[:position], vector, matrix[position + 1:]]).tocsr()
+            
+            titles = dict(index.get('titles', {}))
+            titles[slug] = article.get('title', '').strip()
+            self._save({'k': self.k, 'titles': titles, 'neighbours': neighbours})
+            self._save_model(model)
+
+    def _save(self, index):
+        write_json_atomic(self.path, index, indent=None)
+        self._index = index
+        self._mtime = self.path.stat().st_mtime
+
+    def _save_model(self, model):
+        import numpy as np
+        
+        matrix = model['matrix']
+        terms = sorted(model['vocabulary'], key=model['vocabulary'].get)
+        tmp_path = self.model_path.with_name(f'.{self.model_path.name}.{uuid.uuid4().hex}.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(
+                    f, slugs=np.array(model['slugs'], dtype=str), terms=np.array(terms, dtype=str),
+                    df=model['df'], total=np.int64(model['total']), shape=np.array(matrix.shape, dtype=np.int64),
+                    data=matrix.data, indices=matrix.indices, indptr=matrix.indptr
+                )
+            os.replace(tmp_path, self.model_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _load_model(self):
+        """Model saved by the last build() or add(), or None if there is none"""
+        import numpy as np
+        from scipy import sparse
+        
+        try:
+            with np.load(self.model_path, allow_pickle=False) as saved:
+                slugs = saved['slugs'].tolist()
+                terms = saved['terms'].tolist()
+                matrix = sparse.csr_matrix(
+                    (saved['data'], saved['indices'], saved['indptr']), shape=tuple(saved['shape'].tolist())
+                )
+                df = saved['df'].copy()
+                total = int(saved['total'])
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            self.send_error(500, f"Error updating article stats: {str(e)}")
+            log_event(f"Error reading {self.model_path}: {e}", level='warning')
+            return None
+        return {
+            'slugs': slugs,
+            'positions': {slug: i for i, slug in enumerate(slugs)},
+            'vocabulary': {term: column for column, term in enumerate(terms)},
+            'df': df,
+            'total': total,
+            'matrix': matrix
+        }
+
+    def _load_locked(self):
+        try:
+            mtime = self.path.stat().st_mtime
+        except FileNotFoundError:
+            return {'k': self.k, 'titles': {}, 'neighbours': {}}
+        if mtime != self._mtime:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._index = json.load(f)
+            self._mtime = mtime
+        return self._index
+
+    def related(self, slug):
+        """Neighbours of ``slug`` as dicts, or None if the article is not indexed"""
+        with self._lock:
+            index = self._load_locked()
+        if slug not in index['neighbours']:
+            return None
+        titles = index.get('titles', {})
+        return [
+            {'id': other, 'title': titles.get(other, ''), 'url': f'/articles/{other}/', 'score': score}
+            for other, score in index['neighbours'][slug]
+        ]
+
+
+related_index = RelatedIndex(PROJECT_ROOT / 'articles', PROJECT_ROOT / 'data')
+
+
+class ArticleService:
+    """Article rendering and index maintenance shared by the API and the CLI tools"""
+
+    def __init__(self, project_root=PROJECT_ROOT):
+        self.project_root = project_root
+        self.articles_dir = self.project_root / 'articles'
+        self.data_dir = self.project_root / 'data'
+        self.images_dir = self.project_root / 'assets' / 'images' / 'articles'
+        # Outside articles/ so listing paths can never collide with an article slug
+        self.listing_dir = self.project_root / LISTING_DIR_NAME
+        # Share the server's in-memory stores when working on the same tree
+        same_tree = Path(project_root).resolve() == PROJECT_ROOT.resolve()
+        self.comment_store = comment_store if same_tree else CommentStore(self.articles_dir)
+        self.related_index = related_index if same_tree else RelatedIndex(self.articles_dir, self.data_dir)
+        self.feed_cache = feed_cache if same_tree else FeedCache(self.data_dir)
+        
+        # Ensure directories exist
+        for dir_path in [self.articles_dir, self.data_dir, self.images_dir]:
+            dir_path.mkdir(parents=True, exist_ok=True)
     
     def generate_slug(self, title):
         """Generate URL-friendly slug from title"""
@@ -382,6 +1292,15 @@ class BlogAPIHandler(BaseHTTPRequestHandler):
         slug = slug.strip('-')  # Remove leading/trailing dashes
         return slug
     
+    def validate_slug(self, slug):
+        """Return ``slug`` if it is safe to use as an article directory name"""
+        # Same alphabet generate_slug produces; older slugs may keep edge dashes
+        if not isinstance(slug, str) or not SLUG_PATTERN.fullmatch(slug):
+            raise ValueError(f"Invalid slug: {slug!r}")
+        if slug in RESERVED_SLUGS:
+            raise ValueError(f"Reserved slug: {slug!r}")
+        return slug
+    
     def calculate_reading_time(self, content):
         """Calculate reading time in minutes"""
         text_content = re.sub(r'<[^>]*>', '', content)  # Remove HTML tags
@@ -459,6 +1378,20 @@ class BlogAPIHandler(BaseHTTPRequestHandler):
                         style="{inline_styles}" 
                         id="featured-image">'''
     
+    def asset_tags(self, assets, base_path):
+        """Render <link>/<script> tags, preferring fingerprinted files from the manifest"""
+        bundle_name, members = assets
+        manifest = asset_manifest.get()
+        if bundle_name in manifest.get('bundles', {}):
+            urls = [f"{base_path}dist/{manifest['bundles'][bundle_name]}"]
+        else:
+            files = manifest.get('files', {})
+            urls = [f'{base_path}dist/{files[name]}' if name in files else f'{base_path}{name}' for name in members]
+        
+        if bundle_name.endswith('.css'):
+            return '\n    '.join(f'<link rel="stylesheet" href="{url}">' for url in urls)
+        return '\n    '.join(f'<script src="{url}"></script>' for url in urls)
+    
     def generate_article_html(self, article_data):
         """Generate complete HTML for article"""
         author_info = article_data['author']
@@ -481,8 +1414,7 @@ class BlogAPIHandler(BaseHTTPRequestHandler):
     <meta property="og:url" content="https://kervtalksdata.com/articles/{article_data['slug']}/">
     
     <!-- Stylesheets -->
-    <link rel="stylesheet" href="../../assets/css/main.css">
-    <link rel="stylesheet" href="../../assets/css/responsive.css">
+    {self.asset_tags(ARTICLE_STYLESHEETS, '../../assets/')}
     
     <!-- Structured Data -->
     <script type="application/ld+json">
@@ -719,112 +1651,1149 @@ class BlogAPIHandler(BaseHTTPRequestHandler):
                 <h2>Comments ({article_data['stats']['comments']})</h2>
             </div>
             
-            <div class="comment-form-container">
-                <form class="comment-form" id="comment-form">
-                    <div class="comment-input-group">
-                        <div class="comment-avatar">You</div>
-                        <div class="comment-input-wrapper">
-                            <textarea placeholder="Share your thoughts..." name="content" required></textarea>
-                            <input type="text" placeholder="Your name (optional)" name="author">
-                        </div>
-                    </div>
-                    <button type="submit" class="comment-submit">Post Comment</button>
-                </form>
-            </div>
+            <div class="comment-form-container">
+                <form class="comment-form" id="comment-form">
+                    <div class="comment-input-group">
+                        <div class="comment-avatar">You</div>
+                        <div class="comment-input-wrapper">
+                            <textarea placeholder="Share your thoughts..." name="content" required></textarea>
+                            <input type="text" placeholder="Your name (optional)" name="author">
+                        </div>
+                    </div>
+                    <button type="submit" class="comment-submit">Post Comment</button>
+                </form>
+            </div>
+            
+            <div class="comments-container" id="comments-container">
+                <p class="no-comments">No comments yet. Be the first to comment!</p>
+            </div>
+        </section>
+    </main>
+
+    <footer class="footer">
+        <div class="footer-content">
+            <p>&copy; 2024 Kerv Talks-Data Blog. All rights reserved.</p>
+        </div>
+    </footer>
+    
+    <!-- JavaScript -->
+    {self.asset_tags(ARTICLE_SCRIPTS, '../../assets/')}
+</body>
+</html>"""
+    
+    def build_article_data(self, fields):
+        """Build a full article record from create-article style fields
+
+        ``tags`` may be a comma-separated string or a list and ``author`` an
+        author id or an author dict, so exported metadata can be re-imported.
+        """
+        title = fields['title']
+        excerpt = fields.get('excerpt') or ''
+        content = fields['content']
+        slug = self.validate_slug(fields.get('slug') or self.generate_slug(title))
+        now = datetime.now().isoformat()
+        
+        tags = fields.get('tags') or []
+        if isinstance(tags, str):
+            tags = [tag.strip() for tag in tags.split(',') if tag.strip()]
+        
+        author = fields.get('author') or 'data-crusader'
+        author_info = author if isinstance(author, dict) else self.get_author_info(author)
+        
+        settings = fields.get('settings') or {
+            'featured': str(fields.get('featured', 'false')).lower() == 'true',
+            'allowComments': str(fields.get('comments', 'true')).lower() == 'true',
+            'notifySubscribers': str(fields.get('notification', 'false')).lower() == 'true',
+            'archived': False
+        }
+        
+        image = fields.get('image')
+        if not isinstance(image, dict):
+            image = {'featured': image or None, 'alt': f'{title} featured image'}
+        
+        return {
+            'id': slug,
+            'slug': slug,
+            'title': title,
+            'excerpt': excerpt,
+            'author': author_info,
+            'published': fields.get('published') or now,
+            'updated': fields.get('updated') or now,
+            'status': fields.get('status') or 'published',
+            'readTime': self.calculate_reading_time(content),
+            'category': fields['category'],
+            'tags': tags,
+            'image': image,
+            'stats': fields.get('stats') or {
+                'views': 0,
+                'likes': 0,
+                'comments': 0,
+                'shares': 0
+            },
+            'seo': {
+                'metaTitle': f'{title} - Kerv Talks-Data Blog',
+                'metaDescription': excerpt,
+                'keywords': tags,
+                'canonical': f'https://kervtalksdata.com/articles/{slug}/'
+            },
+            'settings': settings,
+            'content': content  # Store the actual content
+        }
+    
+    def write_article_files(self, article_data):
+        """Write index.html, metadata.json and comments.json for an article"""
+        slug = self.validate_slug(article_data['slug'])
+        article_dir = self.articles_dir / slug
+        if article_dir.resolve().parent != self.articles_dir.resolve():
+            raise ValueError(f"Invalid slug: {slug!r}")
+        article_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Pages are served while the threaded server writes them
+        article_html = self.generate_article_html(article_data)
+        write_text_atomic(article_dir / 'index.html', article_html)
+        write_json_atomic(article_dir / 'metadata.json', article_data)
+        
+        comments_path = article_dir / COMMENTS_HEADER_FILE
+        if not comments_path.exists():
+            write_json_atomic(comments_path, self.comment_store.default_header(slug))
+    
+    def import_articles(self, records, batch_size=None, workers=4):
+        """Create articles from an iterable of NDJSON lines or dicts
+
+        Pages are rendered and written in a thread pool; articles.json is
+        committed once at the end, or every ``batch_size`` articles.
+        """
+        summary = {'imported': 0, 'failed': []}
+        pending_entries = []
+        in_flight = {}
+        
+        def build_and_write(fields):
+            article_data = self.build_article_data(fields)
+            self.write_article_files(article_data)
+            return self.article_index_entry(article_data)
+        
+        def collect(futures):
+            for future in futures:
+                line_number = in_flight.pop(future)
+                try:
+                    pending_entries.append(future.result())
+                    summary['imported'] += 1
+                except Exception as e:
+                    summary['failed'].append({'line': line_number, 'error': str(e)})
+            if batch_size and len(pending_entries) >= batch_size:
+                self.update_articles_index(pending_entries)
+                pending_entries.clear()
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for line_number, record in enumerate(records, start=1):
+                # Blank lines are skipped here so failures keep source line numbers
+                if isinstance(record, (str, bytes)) and not record.strip():
+                    continue
+                try:
+                    fields = json.loads(record) if isinstance(record, (str, bytes)) else record
+                    if fields is None:
+                        continue
+                    missing = [name for name in ('title', 'category', 'content') if not fields.get(name)]
+                    if missing:
+                        raise ValueError(f"Missing required fields: {', '.join(missing)}")
+                except Exception as e:
+                    summary['failed'].append({'line': line_number, 'error': str(e)})
+                    continue
+                
+                in_flight[executor.submit(build_and_write, fields)] = line_number
+                # Bound memory: never hold more than a few records per worker
+                if len(in_flight) >= workers * 4:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+            collect(list(in_flight))
+        
+        if pending_entries:
+            self.update_articles_index(pending_entries)
+        
+        if summary['imported']:
+            try:
+                self.related_index.build()
+            except ImportError:
+                log_event('Related index not rebuilt: numpy/scipy not installed', level='warning')
+        return summary
+    
+    def iter_articles_ndjson(self):
+        """Yield every article's metadata as one NDJSON line at a time"""
+        for article_dir in sorted(self.articles_dir.iterdir()):
+            metadata_file = article_dir / 'metadata.json'
+            if not metadata_file.is_file():
+                continue
+            try:
+                with open(metadata_file, 'r', encoding='utf-8') as f:
+                    metadata = json.load(f)
+            except Exception as e:
+                log_event(f"Error reading {metadata_file}: {e}", level='error')
+                continue
+            yield json.dumps(metadata, ensure_ascii=False) + '\n'
+    
+    def article_index_entry(self, article_data):
+        """Summary entry stored in articles.json for an article"""
+        return {
+            'id': article_data['id'],
+            'title': article_data['title'],
+            'excerpt': article_data['excerpt'],
+            'author': {
+                'name': article_data['author']['name'],
+                'avatar': article_data['author']['avatar'],
+                'role': article_data['author']['role']
+            },
+            'published': article_data['published'].split('T')[0],  # Date only
+            'readTime': article_data['readTime'],
+            'category': article_data['category'],
+            'tags': article_data['tags'],
+            'image': article_data['image']['featured'] or f"{article_data['slug']}.jpg",
+            'content': f"{article_data['slug']}-content.html",
+            'likes': article_data['stats']['likes'],
+            'comments': article_data['stats']['comments'],
+            'views': article_data['stats']['views']
+        }
+    
+    def listing_pages(self, articles):
+        """Plan every listing page as {relative path: (title, entries, page, total, list path)}
+
+        Listings cover all articles, each category and each tag, newest first,
+        paginated by LISTING_PAGE_SIZE. Page 1 of a list lives at its root and
+        page N at ``page/N/``.
+        """
+        ordered = sorted(articles, key=_published_datetime, reverse=True)
+        lists = {'': ('All articles', ordered)}
+        for article in ordered:
+            groups = [('category', article.get('category'))] + [('tag', tag) for tag in article.get('tags') or []]
+            seen = set()
+            for kind, name in groups:
+                slug = self.generate_slug(str(name or ''))
+                if not slug or (kind, slug) in seen:
+                    continue
+                seen.add((kind, slug))
+                label = f"{'Category' if kind == 'category' else 'Tag'}: {name}"
+                lists.setdefault(f'{kind}/{slug}/', (label, []))[1].append(article)
+        
+        pages = {}
+        for list_path, (title, entries) in lists.items():
+            total = max(1, math.ceil(len(entries) / LISTING_PAGE_SIZE))
+            for page in range(1, total + 1):
+                chunk = entries[(page - 1) * LISTING_PAGE_SIZE:page * LISTING_PAGE_SIZE]
+                page_path = list_path if page == 1 else f'{list_path}page/{page}/'
+                pages[page_path] = (title, chunk, page, total, list_path)
+        return pages
+    
+    def _listing_card_html(self, article, root):
+        """Server-side equivalent of the article card built by articles.js"""
+        author = article.get('author') or {}
+        avatar = html.escape(author.get('avatar', ''))
+        title = html.escape((article.get('title') or '').strip())
+        published = _published_datetime(article).strftime('%B %d, %Y')
+        
+        def list_link(kind, name, css_class=''):
+            # Tags and categories link to their prerendered listing pages
+            slug = self.generate_slug(str(name or ''))
+            label = html.escape(str(name or ''))
+            class_attr = f' class="{css_class}"' if css_class else ''
+            if not slug:
+                return f'<span{class_attr}>{label}</span>'
+            return f'<a{class_attr} href="{root}{LISTING_DIR_NAME}/{kind}/{slug}/">{label}</a>'
+        
+        tags_html = ''.join(list_link('tag', tag, 'article-tag') for tag in article.get('tags') or [])
+        category_html = list_link('category', article.get('category'))
+        
+        placeholder = ('<div style="width: 100%; height: 100%; background: rgba(255, 255, 255, 0.3) !important; '
+                       'border-radius: 12px; display: flex; align-items: center; justify-content: center; '
+                       f'color: #6A7B9A; font-size: 3rem; position: absolute; top: 0; left: 0;">{avatar}</div>')
+        image = article.get('image')
+        if image and image != 'placeholder.jpg':
+            image_html = self._generate_responsive_image_html(image, title, f'{root}assets/images/articles/')
+            image_html = image_html.replace(' id="featured-image"', '')
+        else:
+            image_html = placeholder
+        
+        return f'''<article class="article-card-grid" data-article-id="{html.escape(article['id'])}">
+                <div class="article-image-container">
+                    {image_html}
+                    <div class="article-category">{category_html}</div>
+                </div>
+                <div class="article-content-grid">
+                    <div class="article-header-grid">
+                        <div class="article-avatar-small">{avatar}</div>
+                        <div class="article-info-grid">
+                            <div class="article-author">{html.escape(author.get('name', ''))}</div>
+                            <div class="article-meta">{html.escape(author.get('role', ''))} • {published}</div>
+                        </div>
+                    </div>
+                    <h3 class="article-title-grid">
+                        <a href="{root}articles/{html.escape(article['id'])}/">{title}</a>
+                    </h3>
+                    <p class="article-excerpt-grid">{html.escape(article.get('excerpt') or '')}</p>
+                    <div class="article-tags">{tags_html}</div>
+                    <div class="article-stats">
+                        <span class="stat-item">{article.get('readTime', 1)} min read</span>
+                        <span class="stat-item">{article.get('likes', 0)} likes</span>
+                        <span class="stat-item">{article.get('comments', 0)} comments</span>
+                    </div>
+                </div>
+            </article>'''
+    
+    def generate_listing_html(self, page_path, title, entries, page, total, list_path):
+        """Render one prerendered listing page"""
+        # Pages live under listing/<page_path>; links are relative to the site root
+        root = '../' * (1 + page_path.count('/'))
+        listing_root = f'{root}{LISTING_DIR_NAME}/'
+        
+        def page_href(number):
+            return f'{listing_root}{list_path}' + ('' if number == 1 else f'page/{number}/')
+        
+        links = []
+        if page > 1:
+            links.append(f'<a class="pagination-btn" href="{page_href(page - 1)}" rel="prev">Previous</a>')
+        for number in range(1, total + 1):
+            active = ' active' if number == page else ''
+            links.append(f'<a class="pagination-btn{active}" href="{page_href(number)}">{number}</a>')
+        if page < total:
+            links.append(f'<a class="pagination-btn" href="{page_href(page + 1)}" rel="next">Next</a>')
+        pagination = f'<div class="pagination-container">{"".join(links)}</div>' if total > 1 else ''
+        
+        cards = '\n            '.join(self._listing_card_html(article, root) for article in entries)
+        if not cards:
+            cards = '<div class="no-articles">No articles found matching your criteria.</div>'
+        
+        heading = html.escape(title)
+        page_suffix = f' - Page {page}' if page > 1 else ''
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <link rel="icon" type="image/svg+xml" href="{root}assets/images/favicon.svg">
+    <title>{heading}{page_suffix} - Kerv Talks-Data Blog</title>
+    <meta name="description" content="{heading} on data architecture, information asymmetry, and enterprise data strategies.">
+    <link rel="canonical" href="{SITE_URL}/{LISTING_DIR_NAME}/{page_path}">
+    
+    <!-- Stylesheets -->
+    {self.asset_tags(LISTING_STYLESHEETS, f'{root}assets/')}
+</head>
+<body>
+    <header class="header">
+        <nav class="nav-container">
+            <a href="{root}index.html" class="logo">
+                <div class="logo-icon">KT</div>
+                Kerv Talks-Data
+            </a>
+            
+            <ul class="nav-menu" id="primary-navigation">
+                <li><a href="{root}index.html">Home</a></li>
+                <li><a href="{root}articles/index.html" class="active">Articles</a></li>
+                <li><a href="{root}about.html">About</a></li>
+                <li><a href="{root}contact.html">Contact</a></li>
+            </ul>
+        </nav>
+    </header>
+
+    <main class="main-container">
+        <div class="articles-header">
+            <h1>{heading}</h1>
+        </div>
+        
+        <div class="articles-grid" id="articles-grid">
+            {cards}
+        </div>
+        
+        <div class="pagination" id="pagination">{pagination}</div>
+    </main>
+
+    <footer class="footer">
+        <div class="footer-content">
+            <p>&copy; 2024 Kerv Talks-Data Blog. All rights reserved.</p>
+        </div>
+    </footer>
+    
+    <!-- JavaScript -->
+    {self.asset_tags(LISTING_SCRIPTS, f'{root}assets/')}
+</body>
+</html>"""
+    
+    def prerender_listings(self, articles, force=False):
+        """Regenerate only the listing pages whose visible content changed
+
+        Each page's signature (the card fields of its entries plus its position
+        in the pagination) is kept in listing/manifest.json; pages with
+        an unchanged signature are not rendered or written. Returns the number
+        of pages written.
+
+        ``force`` rewrites every page, and also sweeps the directory for pages
+        the manifest does not know about; stale pages are removed either way.
+        """
+        listing_dir = self.listing_dir
+        manifest_path = listing_dir / LISTING_MANIFEST_FILE
+        previous = {}
+        if manifest_path.exists():
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    previous = json.load(f)
+            except Exception as e:
+                log_event(f"Error reading {manifest_path}: {e}", level='error')
+        existing = set(previous)
+        if force:
+            existing.update(
+                '' if path.parent == listing_dir else f'{path.parent.relative_to(listing_dir).as_posix()}/'
+                for path in listing_dir.rglob('index.html')
+            )
+            previous = {}
+        
+        signatures = {}
+        written = 0
+        for page_path, (title, entries, page, total, list_path) in self.listing_pages(articles).items():
+            card_data = [[entry.get(field) for field in LISTING_CARD_FIELDS] for entry in entries]
+            signature = hashlib.sha1(
+                json.dumps([title, page, total, card_data], sort_keys=True, default=str).encode('utf-8')
+            ).hexdigest()
+            signatures[page_path] = signature
+            if previous.get(page_path) == signature:
+                continue
+            
+            page_dir = listing_dir / page_path
+            page_dir.mkdir(parents=True, exist_ok=True)
+            page_html = self.generate_listing_html(page_path, title, entries, page, total, list_path)
+            # The server and --build-listings may write the same page concurrently
+            write_text_atomic(page_dir / 'index.html', page_html)
+            written += 1
+        
+        # Drop pages for lists that shrank or disappeared
+        for page_path in existing - set(signatures):
+            stale = listing_dir / page_path / 'index.html'
+            if stale.exists():
+                stale.unlink()
+                try:
+                    stale.parent.rmdir()
+                except OSError:
+                    pass  # Still holds deeper pages
+        
+        listing_dir.mkdir(parents=True, exist_ok=True)
+        write_json_atomic(manifest_path, signatures)
+        return written
+    
+    def sync_comment_count(self, slug):
+        """Copy the cached comment count into metadata.json and articles.json"""
+        metadata_file = self.articles_dir / slug / 'metadata.json'
+        with articles_index_lock:
+            with open(metadata_file, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+            count = self.comment_store.count(slug)
+            if metadata.setdefault('stats', {}).get('comments') == count:
+                return
+            metadata['stats']['comments'] = count
+            write_json_atomic(metadata_file, metadata)
+            self.update_articles_json(metadata)
+    
+    def update_articles_json(self, article_data):
+        """Update the main articles.json file"""
+        self.update_articles_index([self.article_index_entry(article_data)])
+    
+    def update_articles_index(self, entries):
+        """Merge index entries into articles.json with a single read and write"""
+        with articles_index_lock:
+            self._update_articles_index(entries)
+    
+    def _update_articles_index(self, entries):
+        articles_file = self.data_dir / 'articles.json'
+        
+        # Read existing articles
+        try:
+            if articles_file.exists():
+                with open(articles_file, 'r', encoding='utf-8') as f:
+                    articles_data = json.load(f)
+            else:
+                articles_data = {'articles': []}
+        except Exception as e:
+            log_event(f"Error reading articles.json: {e}", level='error')
+            articles_data = {'articles': []}
+        
+        positions = {article['id']: i for i, article in enumerate(articles_data['articles'])}
+        new_entries = {}
+        feeds_changed = False
+        for article_entry in entries:
+            existing_index = positions.get(article_entry['id'])
+            if existing_index is None:
+                # Later duplicates within one batch replace earlier ones
+                new_entries[article_entry['id']] = article_entry
+                feeds_changed = True
+                continue
+            
+            # Feeds only depend on the published set, not on stat counters
+            if any(articles_data['articles'][existing_index].get(field) != article_entry[field] for field in FEED_FIELDS):
+                feeds_changed = True
+            
+            # Update existing article
+            articles_data['articles'][existing_index] = article_entry
+        
+        # Add new articles to the beginning, newest first
+        if new_entries:
+            articles_data['articles'][:0] = list(new_entries.values())[::-1]
+        log_event('articles.json updated', updated=len(entries) - len(new_entries), added=len(new_entries))
+        
+        # Write updated articles.json
+        try:
+            write_json_atomic(articles_file, articles_data)
+        except Exception as e:
+            log_event(f"Error writing articles.json: {e}", level='error')
+        
+        if feeds_changed:
+            self.feed_cache.invalidate()
+        
+        try:
+            written = self.prerender_listings(articles_data['articles'])
+            if written:
+                log_event('Listing pages regenerated', pages=written)
+        except Exception as e:
+            log_event(f"Error prerendering listing pages: {e}", level='error')
+
+
+class BlogAPIHandler(ArticleService, BaseHTTPRequestHandler):
+    def __init__(self, *args, **kwargs):
+        ArticleService.__init__(self)
+        BaseHTTPRequestHandler.__init__(self, *args, **kwargs)
+    
+    def do_OPTIONS(self):
+        """Handle CORS preflight requests"""
+        self.send_response(200)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
+        self.end_headers()
+    
+    def admit_request(self, path):
+        """Apply admission control; sends a 429/503 and returns False when shed"""
+        status, retry_after = admission.admit(self.client_address[0], self.command, path)
+        if status == 200:
+            return True
+        
+        body = json.dumps({
+            'success': False,
+            'error': 'Too many requests' if status == 429 else 'Server busy',
+            'retryAfter': retry_after
+        }).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Retry-After', str(retry_after))
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+        self.close_connection = True
+        return False
+    
+    def do_GET(self):
+        """Handle GET requests"""
+        parsed_path = urlparse(self.path)
+        if not self.admit_request(parsed_path.path):
+            return
+        
+        try:
+            if parsed_path.path.startswith('/api/'):
+                self.route_api_request(parsed_path)
+            elif parsed_path.path.lstrip('/') in FEED_RENDERERS:
+                self.handle_feed(parsed_path.path.lstrip('/'))
+            else:
+                self.handle_static(parsed_path.path)
+        finally:
+            admission.release()
+
+    def route_api_request(self, parsed_path):
+        """Dispatch API routes"""
+        if parsed_path.path == '/api/health':
+            self.handle_health()
+        elif parsed_path.path == '/api/articles':
+            self.handle_get_articles()
+        elif parsed_path.path == '/api/articles/export':
+            self.handle_export_articles()
+        elif parsed_path.path.startswith('/api/articles/') and parsed_path.path.endswith('/comments'):
+            slug = parsed_path.path.split('/')[-2]
+            self.handle_get_comments(slug, parse_qs(parsed_path.query))
+        elif parsed_path.path.startswith('/api/articles/') and parsed_path.path.endswith('/related'):
+            slug = parsed_path.path.split('/')[-2]
+            self.handle_get_related(slug)
+        elif parsed_path.path.startswith('/api/articles/'):
+            slug = parsed_path.path.split('/')[-1]
+            self.handle_get_article(slug)
+        else:
+            self.send_error(404, "Not Found")
+
+    def handle_feed(self, name):
+        """Serve RSS/Atom feeds and the sitemap from the in-memory cache"""
+        try:
+            body, etag, content_type = self.feed_cache.get(name)
+        except Exception as e:
+            self.send_error(500, f"Error generating {name}: {str(e)}")
+            return
+        
+        if etag_matches(self.headers.get('If-None-Match'), etag):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'public, max-age=300')
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def handle_static(self, url_path):
+        """Serve static files for the blog UI so port 1978 mirrors the site"""
+        relative_path = url_path.lstrip('/')
+        if not relative_path:
+            relative_path = 'index.html'
+        
+        file_path = (self.project_root / relative_path).resolve()
+        try:
+            project_root_resolved = self.project_root.resolve()
+        except FileNotFoundError:
+            project_root_resolved = self.project_root
+        
+        # Prevent directory traversal
+        if not str(file_path).startswith(str(project_root_resolved)):
+            self.send_error(403, "Forbidden")
+            return
+        
+        if file_path.is_dir() and url_path.endswith('/'):
+            file_path = file_path / 'index.html'
+        
+        if not file_path.exists() or file_path.is_dir():
+            self.send_error(404, "Not Found")
+            return
+        
+        content_type, _ = mimetypes.guess_type(str(file_path))
+        if not content_type:
+            content_type = 'application/octet-stream'
+        
+        try:
+            with open(file_path, 'rb') as fp:
+                data = fp.read()
+        except Exception as exc:
+            log_event(f"Error reading {file_path}: {exc}", level='error')
+            self.send_error(500, "Failed to read file")
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Content-Length', str(len(data)))
+        if relative_path.startswith('assets/dist/') and not relative_path.endswith(ASSET_MANIFEST_FILE):
+            # Fingerprinted names change with content, so they never need revalidation
+            self.send_header('Cache-Control', IMMUTABLE_CACHE_CONTROL)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(data)
+    
+    def do_POST(self):
+        """Handle POST requests"""
+        parsed_path = urlparse(self.path)
+        if not self.admit_request(parsed_path.path):
+            return
+        
+        try:
+            if parsed_path.path == '/api/create-article':
+                self.handle_create_article()
+            elif parsed_path.path == '/api/articles/bulk':
+                self.handle_bulk_import(parse_qs(parsed_path.query))
+            elif parsed_path.path.startswith('/api/articles/') and parsed_path.path.endswith('/stats'):
+                slug = parsed_path.path.split('/')[-2]
+                self.handle_update_stats(slug)
+            elif parsed_path.path.startswith('/api/articles/') and parsed_path.path.endswith('/comments'):
+                slug = parsed_path.path.split('/')[-2]
+                self.handle_create_comment(slug)
+            elif parsed_path.path in ('/api/newsletter', '/api/newsletter/subscribe'):
+                self.handle_newsletter_subscribe()
+            else:
+                self.send_error(404, "Not Found")
+        finally:
+            admission.release()
+    
+    def handle_health(self):
+        """Health check endpoint"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        
+        response = {
+            'status': 'OK',
+            'message': 'Kerv Talks-Data Blog API is running',
+            'timestamp': datetime.now().isoformat(),
+            'admission': admission.snapshot(),
+            'accessLog': access_log.snapshot()
+        }
+        self.wfile.write(json.dumps(response).encode())
+    
+    def handle_get_articles(self):
+        """Get all articles"""
+        try:
+            articles_file = self.data_dir / 'articles.json'
+            if articles_file.exists():
+                with open(articles_file, 'r', encoding='utf-8') as f:
+                    articles_data = json.load(f)
+            else:
+                articles_data = {'articles': []}
+            
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(json.dumps(articles_data).encode())
+            
+        except Exception as e:
+            self.send_error(500, f"Error reading articles: {str(e)}")
+    
+    def handle_get_article(self, slug):
+        """Get specific article"""
+        try:
+            article_dir = self.articles_dir / slug
+            metadata_file = article_dir / 'metadata.json'
+            
+            if metadata_file.exists():
+                with open(metadata_file, 'r', encoding='utf-8') as f:
+                    metadata = json.load(f)
+                
+                if 'stats' in metadata:
+                    metadata['stats']['comments'] = comment_store.count(slug)
+                
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+                self.wfile.write(json.dumps(metadata).encode())
+            else:
+                self.send_error(404, "Article not found")
+                
+        except Exception as e:
+            self.send_error(500, f"Error reading article: {str(e)}")
+    
+    def handle_create_article(self):
+        """Create new article"""
+        try:
+            # Parse multipart form data
+            content_type = self.headers.get('Content-Type', '')
+            if not content_type.startswith('multipart/form-data'):
+                self.send_error(400, "Content-Type must be multipart/form-data")
+                return
+            
+            # Parse form data
+            form = cgi.FieldStorage(
+                fp=self.rfile,
+                headers=self.headers,
+                environ={'REQUEST_METHOD': 'POST'}
+            )
+            
+            # Extract form fields
+            fields = {
+                name: form.getvalue(name, default).strip()
+                for name, default in [
+                    ('title', ''), ('excerpt', ''), ('category', ''), ('author', 'data-crusader'),
+                    ('tags', ''), ('content', ''), ('featured', 'false'), ('comments', 'true'),
+                    ('notification', 'false')
+                ]
+            }
+            
+            # Validate required fields
+            if not fields['title'] or not fields['category'] or not fields['content']:
+                self.send_error(400, "Missing required fields: title, category, and content are required")
+                return
             
-            <div class="comments-container" id="comments-container">
-                <p class="no-comments">No comments yet. Be the first to comment!</p>
-            </div>
-        </section>
-    </main>
-
-    <footer class="footer">
-        <div class="footer-content">
-            <p>&copy; 2024 Kerv Talks-Data Blog. All rights reserved.</p>
-        </div>
-    </footer>
+            try:
+                article_data = self.build_article_data(fields)
+            except ValueError as e:
+                self.send_error(400, str(e))
+                return
+            slug = article_data['slug']
+            
+            # Handle image upload
+            if 'featuredImage' in form:
+                image_file = form['featuredImage']
+                if image_file.filename:
+                    # Save image
+                    image_ext = os.path.splitext(image_file.filename)[1]
+                    image_filename = f'{slug}{image_ext}'
+                    image_path = self.images_dir / image_filename
+                    
+                    with open(image_path, 'wb') as f:
+                        f.write(image_file.file.read())
+                    
+                    article_data['image']['featured'] = image_filename
+                    log_event('Image uploaded', image=image_filename)
+            
+            self.write_article_files(article_data)
+            
+            # Update articles.json
+            self.update_articles_json(article_data)
+            log_event('Article created', slug=slug)
+            
+            try:
+                self.related_index.add(article_data)
+            except ImportError:
+                log_event('Related index not updated: numpy/scipy not installed', level='warning')
+            except Exception as e:
+                log_event(f"Error updating related index: {e}", level='error')
+            
+            # Send success response
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            
+            response = {
+                'success': True,
+                'message': 'Article created successfully!',
+                'article': {
+                    'id': article_data['id'],
+                    'slug': article_data['slug'],
+                    'title': article_data['title'],
+                    'url': f'http://localhost:1977/articles/{slug}/'
+                }
+            }
+            self.wfile.write(json.dumps(response).encode())
+            
+        except Exception as e:
+            log_event(f"Error creating article: {str(e)}", level='error')
+            self.send_error(500, f"Failed to create article: {str(e)}")
     
-    <!-- JavaScript -->
-    <script src="../../assets/js/config.js"></script>
-    <script src="../../assets/js/main.js"></script>
-    <script src="../../assets/js/article.js"></script>
-    <script src="../../assets/js/newsletter.js"></script>
-    <script src="../../assets/js/analytics.js"></script>
-</body>
-</html>"""
+    def handle_bulk_import(self, query):
+        """Create many articles from an NDJSON request body"""
+        try:
+            try:
+                batch_size = int(query.get('batch_size', ['0'])[0]) or None
+                workers = min(BULK_IMPORT_MAX_WORKERS, max(1, int(query.get('workers', ['4'])[0])))
+            except ValueError:
+                self.send_error(400, "batch_size and workers must be integers")
+                return
+            
+            content_length = int(self.headers.get('Content-Length', 0))
+            
+            def body_lines():
+                # Stream the body line by line instead of buffering it
+                remaining = content_length
+                while remaining > 0:
+                    line = self.rfile.readline(remaining)
+                    if not line:
+                        break
+                    remaining -= len(line)
+                    yield line
+            
+            summary = self.import_articles(body_lines(), batch_size=batch_size, workers=workers)
+            log_event('Bulk import', imported=summary['imported'], failed=len(summary['failed']))
+            
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            
+            response = {'success': not summary['failed'], **summary}
+            self.wfile.write(json.dumps(response).encode())
+            
+        except Exception as e:
+            log_event(f"Error importing articles: {str(e)}", level='error')
+            self.send_error(500, f"Failed to import articles: {str(e)}")
     
-    def update_articles_json(self, article_data):
-        """Update the main articles.json file"""
-        articles_file = self.data_dir / 'articles.json'
+    def handle_export_articles(self):
+        """Stream every article as NDJSON"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson; charset=utf-8')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
         
-        # Read existing articles
+        # No Content-Length: the body ends when the connection closes
+        for line in self.iter_articles_ndjson():
+            self.wfile.write(line.encode('utf-8'))
+        self.wfile.flush()
+    
+    def handle_update_stats(self, slug):
+        """Update article stats"""
         try:
-            if articles_file.exists():
-                with open(articles_file, 'r', encoding='utf-8') as f:
-                    articles_data = json.load(f)
+            # Read request body
+            content_length = int(self.headers.get('Content-Length', 0))
+            post_data = self.rfile.read(content_length)
+            data = json.loads(post_data.decode('utf-8'))
+            
+            stat_type = data.get('type')
+            increment = data.get('increment', 1)
+            
+            if not stat_type:
+                self.send_error(400, "Missing stat type")
+                return
+            
+            article_dir = self.articles_dir / slug
+            metadata_file = article_dir / 'metadata.json'
+            
+            if metadata_file.exists():
+                with articles_index_lock:
+                    with open(metadata_file, 'r', encoding='utf-8') as f:
+                        metadata = json.load(f)
+                    
+                    valid_stat = 'stats' in metadata and stat_type in metadata['stats']
+                    if valid_stat:
+                        metadata['stats'][stat_type] += increment
+                        metadata['updated'] = datetime.now().isoformat()
+                        
+                        write_json_atomic(metadata_file, metadata)
+                        
+                        # Also update articles.json
+                        self.update_articles_json(metadata)
+                
+                if valid_stat:
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Access-Control-Allow-Origin', '*')
+                    self.end_headers()
+                    
+                    response = {'success': True, 'stats': metadata['stats']}
+                    self.wfile.write(json.dumps(response).encode())
+                else:
+                    self.send_error(400, "Invalid stat type")
             else:
-                articles_data = {'articles': []}
+                self.send_error(404, "Article not found")
+                
         except Exception as e:
-            print(f"Error reading articles.json: {e}")
-            articles_data = {'articles': []}
-        
-        # Check if article already exists
-        existing_index = None
-        for i, article in enumerate(articles_data['articles']):
-            if article['id'] == article_data['id']:
-                existing_index = i
-                break
-        
-        # Create article entry
-        article_entry = {
-            'id': article_data['id'],
-            'title': article_data['title'],
-            'excerpt': article_data['excerpt'],
-            'author': {
-                'name': article_data['author']['name'],
-                'avatar': article_data['author']['avatar'],
-                'role': article_data['author']['role']
-            },
-            'published': article_data['published'].split('T')[0],  # Date only
-            'readTime': article_data['readTime'],
-            'category': article_data['category'],
-            'tags': article_data['tags'],
-            'image': article_data['image']['featured'] or f"{article_data['slug']}.jpg",
-            'content': f"{article_data['slug']}-content.html",
-            'likes': article_data['stats']['likes'],
-            'comments': article_data['stats']['comments'],
-            'views': article_data['stats']['views']
-        }
-        
-        if existing_index is not None:
-            # Update existing article
-            articles_data['articles'][existing_index] = article_entry
-            print("📝 Updated existing article in articles.json")
-        else:
-            # Add new article to the beginning
-            articles_data['articles'].insert(0, article_entry)
-            print("📝 Added new article to articles.json")
-        
-        # Write updated articles.json
+            self.send_error(500, f"Error updating article stats: {str(e)}")
+    
+    def handle_get_related(self, slug):
+        """Related articles from the precomputed similarity index"""
+        try:
+            if not (self.articles_dir / slug / 'metadata.json').exists():
+                self.send_error(404, "Article not found")
+                return
+            
+            related = self.related_index.related(slug)
+            
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            
+            response = {'articleId': slug, 'related': related or [], 'indexed': related is not None}
+            self.wfile.write(json.dumps(response).encode())
+            
+        except Exception as e:
+            self.send_error(500, f"Error reading related articles: {str(e)}")
+    
+    def handle_get_comments(self, slug, query):
+        """List comments for an article with cursor pagination"""
+        try:
+            if not (self.articles_dir / slug / 'metadata.json').exists():
+                self.send_error(404, "Article not found")
+                return
+            
+            try:
+                cursor = int(query.get('cursor', ['0'])[0] or 0)
+                limit = int(query.get('limit', [str(COMMENTS_PAGE_SIZE)])[0])
+            except ValueError:
+                self.send_error(400, "cursor and limit must be integers")
+                return
+            if cursor < 0:
+                self.send_error(400, "Invalid cursor")
+                return
+            limit = max(1, min(limit, COMMENTS_MAX_PAGE_SIZE))
+            
+            try:
+                comments, next_cursor = comment_store.page(slug, cursor, limit)
+            except ValueError:
+                self.send_error(400, "Invalid cursor")
+                return
+            
+            header = comment_store.header(slug)
+            response = {
+                'articleId': slug,
+                'comments': [c for c in comments if c.get('approved', True)],
+                'stats': header['stats'],
+                'nextCursor': str(next_cursor) if next_cursor is not None else None
+            }
+            
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(json.dumps(response).encode())
+            
+        except Exception as e:
+            self.send_error(500, f"Error reading comments: {str(e)}")
+    
+    def handle_create_comment(self, slug):
+        """Append a comment to an article"""
+        try:
+            metadata_file = self.articles_dir / slug / 'metadata.json'
+            if not metadata_file.exists():
+                self.send_error(404, "Article not found")
+                return
+            
+            content_length = int(self.headers.get('Content-Length', 0))
+            post_data = self.rfile.read(content_length)
+            try:
+                data = json.loads(post_data.decode('utf-8'))
+            except ValueError:
+                self.send_error(400, "Invalid JSON body")
+                return
+            if not isinstance(data, dict):
+                self.send_error(400, "JSON body must be an object")
+                return
+            
+            with open(metadata_file, 'r', encoding='utf-8') as f:
+                settings = json.load(f).get('settings') or {}
+            if not settings.get('allowComments', True):
+                self.send_error(403, "Comments are disabled for this article")
+                return
+            
+            content = str(data.get('content', '')).strip()
+            author = str(data.get('author', '')).strip()
+            parent_id = data.get('parentId') or None
+            
+            moderation = comment_store.header(slug)['moderation']
+            if not content:
+                self.send_error(400, "Missing comment content")
+                return
+            if len(content) > moderation.get('maxLength', 1000):
+                self.send_error(400, "Comment is too long")
+                return
+            if not author:
+                if not moderation.get('allowAnonymous', True):
+                    self.send_error(400, "Author name is required")
+                    return
+                author = 'Anonymous'
+            
+            comment = comment_store.append(slug, author, content, parent_id)
+            try:
+                self.sync_comment_count(slug)
+            except Exception as e:
+                # The comment is stored; the counters catch up on the next comment
+                log_event(f"Error updating comment count: {e}", level='error', slug=slug)
+            
+            self.send_response(201)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            
+            response = {
+                'success': True,
+                'comment': comment,
+                'stats': {'comments': comment_store.count(slug)}
+            }
+            self.wfile.write(json.dumps(response).encode())
+            
+        except Exception as e:
+            self.send_error(500, f"Error creating comment: {str(e)}")
+    
+    def handle_newsletter_subscribe(self):
+        """Subscribe an email address to the newsletter"""
         try:
-            with open(articles_file, 'w', encoding='utf-8') as f:
-                json.dump(articles_data, f, indent=2, ensure_ascii=False)
+            content_length = int(self.headers.get('Content-Length', 0))
+            post_data = self.rfile.read(content_length)
+            try:
+                data = json.loads(post_data.decode('utf-8'))
+            except ValueError:
+                data = None
+            
+            email = normalize_email(data.get('email')) if isinstance(data, dict) else ''
+            if not email or not EMAIL_PATTERN.match(email):
+                self.send_response(400)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+                response = {'success': False, 'error': 'Please enter a valid email address'}
+                self.wfile.write(json.dumps(response).encode())
+                return
+            
+            subscription, created = newsletter_store.subscribe(
+                email,
+                name=data.get('name') or None,
+                sessionId=data.get('sessionId'),
+                source=data.get('source') or 'newsletter_signup',
+                pageUrl=data.get('pageUrl'),
+                referrer=data.get('referrer'),
+                componentId=data.get('componentId')
+            )
+            
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            
+            response = {
+                'success': True,
+                'message': 'Successfully subscribed to newsletter!' if created else 'You are already subscribed!',
+                'subscription': {
+                    'id': subscription.get('id'),
+                    'email': subscription['email'],
+                    'status': subscription['status']
+                }
+            }
+            self.wfile.write(json.dumps(response).encode())
+            
         except Exception as e:
-            print(f"Error writing articles.json: {e}")
+            self.send_error(500, f"Error processing subscription: {str(e)}")
+    
+    def setup(self):
+        super().setup()
+        self.wfile = _CountingWriter(self.wfile)
+    
+    def handle_one_request(self):
+        """Time each request and hand a structured record to the access log"""
+        started = time.perf_counter()
+        self.wfile.bytes_written = 0
+        self._response_status = None
+        super().handle_one_request()
+        if self._response_status is not None:
+            access_log.record_request(
+                self.command,
+                urlparse(getattr(self, 'path', '')).path,
+                self._response_status,
+                self.wfile.bytes_written,
+                time.perf_counter() - started,
+                self.client_address[0]
+            )
+    
+    def log_request(self, code='-', size='-'):
+        """Capture the status; the record itself is written by handle_one_request"""
+        try:
+            self._response_status = int(code)
+        except (TypeError, ValueError):
+            self._response_status = 0
     
     def log_message(self, format, *args):
-        """Override to customize logging"""
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {format % args}")
+        """Route server messages (mostly errors) into the access log"""
+        log_event(format % args, level='warning', client=self.client_address[0])
+
+def warm_related_index():
+    """Load or build the related-articles model off the request path"""
+    try:
+        related_index.warm()
+    except ImportError:
+        log_event('Related index not warmed: numpy/scipy not installed', level='warning')
+    except Exception as e:
+        log_event(f"Error warming related index: {e}", level='error')
+
 
 def run_server(port=1978):
     """Run the API server"""
     server_address = ('', port)
-    httpd = HTTPServer(server_address, BlogAPIHandler)
+    httpd = ThreadingHTTPServer(server_address, BlogAPIHandler)
+    newsletter_store.load()
+    access_log.start()
+    threading.Thread(target=warm_related_index, name='related-warmup', daemon=True).start()
     
     print(f"🚀 Kerv Talks-Data Blog API Server running on port {port}")
     print(f"📝 Article creation endpoint: http://localhost:{port}/api/create-article")
     print(f"📚 Articles list endpoint: http://localhost:{port}/api/articles")
+    print(f"📦 Bulk import/export: http://localhost:{port}/api/articles/bulk, /api/articles/export")
+    print(f"🔗 Related articles: http://localhost:{port}/api/articles/<slug>/related")
+    print(f"💬 Comments endpoint: http://localhost:{port}/api/articles/<slug>/comments")
+    print(f"📧 Newsletter endpoint: http://localhost:{port}/api/newsletter")
+    print(f"📰 Feeds: http://localhost:{port}/feed.xml, /atom.xml, /sitemap.xml")
     print(f"🔍 Health check: http://localhost:{port}/api/health")
+    print(f"🧾 Access log: {ACCESS_LOG_DIR / ACCESS_LOG_FILE}")
     print("Press Ctrl+C to stop the server")
     
     try:
@@ -832,8 +2801,39 @@ def run_server(port=1978):
     except KeyboardInterrupt:
         print("\n🛑 Server stopped")
         httpd.server_close()
+        newsletter_store.close()
+        access_log.close()
 
 if __name__ == '__main__':
+    if '--build-assets' in sys.argv:
+        # Build-time mode: fingerprint assets/css and assets/js into assets/dist
+        manifest = build_assets(minify='--minify' in sys.argv, bundle='--bundle' in sys.argv)
+        print(f"📦 Fingerprinted {len(manifest['files'])} asset(s), {len(manifest['bundles'])} bundle(s)")
+        print(f"📄 Wrote: {(ASSET_DIST_DIR / ASSET_MANIFEST_FILE).relative_to(PROJECT_ROOT)}")
+        sys.exit(0)
+    
+    if '--build-listings' in sys.argv:
+        # Build-time mode: prerender every listing page from data/articles.json
+        service = ArticleService()
+        with open(service.data_dir / 'articles.json', 'r', encoding='utf-8') as f:
+            articles = json.load(f).get('articles', [])
+        written = service.prerender_listings(articles, force=True)
+        print(f"📄 Prerendered {written} listing page(s) under {LISTING_DIR_NAME}/")
+        sys.exit(0)
+    
+    if '--build-related' in sys.argv:
+        # Build-time mode: recompute data/related.json (requires numpy and scipy)
+        started = time.perf_counter()
+        count = related_index.build()
+        print(f"🔗 Indexed related articles for {count} article(s) in {time.perf_counter() - started:.2f}s")
+        sys.exit(0)
+    
+    if '--build-feeds' in sys.argv:
+        # Build-time mode: write feed.xml, atom.xml and sitemap.xml for static_server.py
+        for path in feed_cache.write(PROJECT_ROOT):
+            print(f"📄 Wrote: {path.relative_to(PROJECT_ROOT)}")
+        sys.exit(0)
+    
     port_arg = 1979
     if len(sys.argv) > 1:
         try:
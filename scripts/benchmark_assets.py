@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+"""
+Measure requests and bytes for a repeat article page view, before and after
+asset fingerprinting.
+
+Renders an article page with plain asset URLs and again with fingerprinted
+URLs from `api_server.py --build-assets`, serves both through static_server.py,
+and replays a first and a repeat view against a simple browser cache that
+honours Cache-Control. Assets are fingerprinted into a temporary copy, so the
+repository's assets/dist is left untouched.
+
+Usage: python3 scripts/benchmark_assets.py [--minify] [--bundle]
+"""
+
+import functools
+import json
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import http.client
+import socketserver
+from pathlib import Path
+from urllib.parse import urljoin
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import api_server  # noqa: E402
+from static_server import NoCacheHTTPRequestHandler  # noqa: E402
+
+PAGE_PATH = '/articles/benchmark/'
+ASSET_URL_PATTERN = re.compile(r'(?:href|src)="(\.\./\.\./assets/(?:css|js|dist)/[^"]+)"')
+
+
+class QuietHandler(NoCacheHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def fetch(port, path):
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    conn.request('GET', path)
+    response = conn.getresponse()
+    body = response.read()
+    conn.close()
+    return len(body), response.getheader('Cache-Control', '')
+
+
+def cacheable(cache_control):
+    if 'no-store' in cache_control or 'no-cache' in cache_control:
+        return False
+    match = re.search(r'max-age=(\d+)', cache_control)
+    return bool(match and int(match.group(1)) > 0)
+
+
+def page_views(port, page_html):
+    """Return (first view, repeat view) as (requests, bytes) tuples"""
+    asset_paths = [urljoin(PAGE_PATH, url) for url in ASSET_URL_PATTERN.findall(page_html)]
+    page_bytes = len(page_html.encode('utf-8'))
+
+    cache = {}
+    first = [1, page_bytes]
+    for path in asset_paths:
+        size, cache_control = fetch(port, path)
+        first[0] += 1
+        first[1] += size
+        if cacheable(cache_control):
+            cache[path] = size
+
+    # The HTML itself is always refetched: static_server sends it no-store
+    repeat = [1, page_bytes]
+    for path in asset_paths:
+        if path not in cache:
+            size, _ = fetch(port, path)
+            repeat[0] += 1
+            repeat[1] += size
+    return tuple(first), tuple(repeat)
+
+
+def render_page(service):
+    article = service.build_article_data({
+        'title': 'Benchmark article',
+        'category': 'Data',
+        'content': '<p>' + 'word ' * 800 + '</p>',
+        'tags': 'benchmark'
+    })
+    return service.generate_article_html(article)
+
+
+def main():
+    service = api_server.ArticleService()
+    original_manifest_path = api_server.asset_manifest.path
+
+    with tempfile.TemporaryDirectory() as tmp:
+        assets_dir = Path(tmp) / 'assets'
+        for kind in api_server.ASSET_SOURCE_DIRS:
+            shutil.copytree(api_server.ASSETS_DIR / kind, assets_dir / kind)
+        dist_dir = assets_dir / 'dist'
+
+        handler = functools.partial(QuietHandler, directory=tmp)
+        httpd = socketserver.TCPServer(('127.0.0.1', 0), handler)
+        port = httpd.server_address[1]
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+        try:
+            # Before: no manifest in the copy yet, so plain URLs are emitted
+            api_server.asset_manifest.path = dist_dir / api_server.ASSET_MANIFEST_FILE
+            before = page_views(port, render_page(service))
+
+            manifest = api_server.build_assets(minify='--minify' in sys.argv, bundle='--bundle' in sys.argv,
+                                               assets_dir=assets_dir, dist_dir=dist_dir)
+            after = page_views(port, render_page(service))
+        finally:
+            api_server.asset_manifest.path = original_manifest_path
+            api_server.asset_manifest.invalidate()
+            httpd.shutdown()
+            httpd.server_close()
+
+    print(json.dumps({'files': len(manifest['files']), 'bundles': len(manifest['bundles'])}))
+    print(f"{'':<24}{'requests':>10}{'bytes':>12}")
+    for label, (first, repeat) in (('before', before), ('after', after)):
+        print(f"{label + ' (first view)':<24}{first[0]:>10}{first[1]:>12}")
+        print(f"{label + ' (repeat view)':<24}{repeat[0]:>10}{repeat[1]:>12}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark feed requests/sec with and without the in-memory feed cache.
+
+Usage: python3 scripts/benchmark_feeds.py [requests-per-run]
+"""
+
+import sys
+import threading
+import time
+import http.client
+from http.server import HTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api_server import BlogAPIHandler, FEED_RENDERERS, admission, feed_cache  # noqa: E402
+
+
+def run(port, name, requests):
+    """Issue ``requests`` sequential GETs and return requests/sec"""
+    start = time.perf_counter()
+    for _ in range(requests):
+        conn = http.client.HTTPConnection('127.0.0.1', port)
+        conn.request('GET', f'/{name}')
+        response = conn.getresponse()
+        response.read()
+        conn.close()
+        if response.status != 200:
+            raise RuntimeError(f'/{name} returned {response.status}')
+    return requests / (time.perf_counter() - start)
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    BlogAPIHandler.log_message = lambda *args: None
+    admission.enabled = False
+    httpd = HTTPServer(('127.0.0.1', 0), BlogAPIHandler)
+    port = httpd.server_address[1]
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    print(f"{'feed':<14}{'uncached req/s':>16}{'cached req/s':>16}{'speedup':>10}")
+    try:
+        for name in FEED_RENDERERS:
+            feed_cache.enabled = False
+            uncached = run(port, name, requests)
+            feed_cache.enabled = True
+            feed_cache.invalidate()
+            cached = run(port, name, requests)
+            print(f"{name:<14}{uncached:>16.0f}{cached:>16.0f}{cached / uncached:>9.1f}x")
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
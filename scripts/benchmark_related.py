@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+"""
+Time the related-articles index on synthetic articles.
+
+Builds the full TF-IDF index for N generated articles (10k by default), then
+times incremental add() calls for a handful of new ones, and the first add()
+of a fresh instance that has to load the saved model, and re-creating an
+existing slug. Requires numpy and scipy.
+
+Usage: python3 scripts/benchmark_related.py [articles]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api_server import RELATED_MODEL_FILE, RelatedIndex, related_terms  # noqa: E402
+
+WORDS = [f'term{i}' for i in range(20000)]
+TAGS = [f'tag{i}' for i in range(300)]
+CATEGORIES = ['Analytics', 'Strategy', 'Technology', 'Data', 'Leadership', 'AI']
+ADDED = 20
+
+
+def synthetic_article(rng, i):
+    # Zipf-like word frequencies, roughly 600 words per article
+    words = [WORDS[min(int(rng.paretovariate(1.1)) - 1, len(WORDS) - 1)] for _ in range(600)]
+    return {
+        'id': f'synthetic-{i}',
+        'slug': f'synthetic-{i}',
+        'title': f'Synthetic article {i}',
+        'excerpt': ' '.join(words[:30]),
+        'content': '<p>' + ' '.join(words) + '</p>',
+        'tags': rng.sample(TAGS, 4),
+        'category': rng.choice(CATEGORIES)
+    }
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rng = random.Random(42)
+    articles = [synthetic_article(rng, i) for i in range(total + ADDED)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = RelatedIndex(Path(tmp), Path(tmp))
+
+        started = time.perf_counter()
+        documents = [(a['slug'], a['title'], related_terms(a)) for a in articles[:total]]
+        tokenized = time.perf_counter()
+        index.build(documents)
+        built = time.perf_counter()
+
+        for article in articles[total:-1]:
+            index.add(article)
+        added = time.perf_counter()
+
+        # A fresh instance stands in for a restarted server: it loads the saved model
+        restarted_index = RelatedIndex(Path(tmp), Path(tmp))
+        restarted_index.add(articles[-1])
+        restarted = time.perf_counter()
+
+        # Re-creating an existing slug replaces its row in place
+        restarted_index.add(dict(articles[total], slug=articles[0]['slug']))
+        recreated = time.perf_counter()
+
+        size = (Path(tmp) / 'related.json').stat().st_size
+        model_size = (Path(tmp) / RELATED_MODEL_FILE).stat().st_size
+
+    print(f"articles:            {total}")
+    print(f"tokenize:            {tokenized - started:8.2f}s")
+    print(f"build (tf-idf+top-k):{built - tokenized:8.2f}s")
+    print(f"incremental add:     {(added - built) / (ADDED - 1) * 1000:8.1f}ms per article")
+    print(f"first add (restart): {(restarted - added) * 1000:8.1f}ms")
+    print(f"re-create add:       {(recreated - restarted) * 1000:8.1f}ms")
+    print(f"index size:          {size / 1024:8.0f}KB")
+    print(f"model size:          {model_size / 1024:8.0f}KB")
+
+
+if __name__ == '__main__':
+    main()
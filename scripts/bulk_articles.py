@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+"""
+Bulk article import/export using NDJSON (one article record per line).
+
+Usage:
+    python3 scripts/bulk_articles.py import articles.ndjson [--batch-size N] [--workers N]
+    python3 scripts/bulk_articles.py export articles.ndjson
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api_server import ArticleService  # noqa: E402
+
+
+def import_articles(args):
+    service = ArticleService()
+    source = sys.stdin if args.file == '-' else open(args.file, 'r', encoding='utf-8')
+    try:
+        summary = service.import_articles(source, batch_size=args.batch_size, workers=args.workers)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    print(f"✅ Imported {summary['imported']} article(s)")
+    for failure in summary['failed']:
+        print(f"❌ Line {failure['line']}: {failure['error']}")
+    return 1 if summary['failed'] else 0
+
+
+def export_articles(args):
+    service = ArticleService()
+    target = sys.stdout if args.file == '-' else open(args.file, 'w', encoding='utf-8')
+    count = 0
+    try:
+        for line in service.iter_articles_ndjson():
+            target.write(line)
+            count += 1
+    finally:
+        if target is not sys.stdout:
+            target.close()
+
+    print(f"✅ Exported {count} article(s)", file=sys.stderr)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk NDJSON article import/export')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = subparsers.add_parser('import', help='Create articles from an NDJSON file')
+    import_parser.add_argument('file', help="NDJSON file, or '-' for stdin")
+    import_parser.add_argument('--batch-size', type=int, default=None,
+                               help='Commit articles.json every N articles (default: once at the end)')
+    import_parser.add_argument('--workers', type=int, default=4, help='Page rendering threads')
+    import_parser.set_defaults(func=import_articles)
+
+    export_parser = subparsers.add_parser('export', help='Write every article as NDJSON')
+    export_parser.add_argument('file', help="Output file, or '-' for stdout")
+    export_parser.set_defaults(func=export_articles)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -3,12 +3,26 @@ import http.server
 import socketserver
 import os
 
+# Fingerprinted files written by `api_server.py --build-assets`
+FINGERPRINTED_PREFIX = '/assets/dist/'
+MANIFEST_NAME = 'manifest.json'
+
 class NoCacheHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    def send_response(self, code, message=None):
+        self._status = code
+        super().send_response(code, message)
+
     def end_headers(self):
-        # Add no-cache headers
-        self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-        self.send_header('Pragma', 'no-cache')
-        self.send_header('Expires', '0')
+        path = self.path.split('?', 1)[0]
+        fingerprinted = path.startswith(FINGERPRINTED_PREFIX) and not path.endswith(MANIFEST_NAME)
+        if fingerprinted and getattr(self, '_status', None) == 200:
+            # Content-hashed names never change, so cache them forever
+            self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
+        else:
+            # Add no-cache headers (errors too, so a 404 is not cached for a year)
+            self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
+            self.send_header('Pragma', 'no-cache')
+            self.send_header('Expires', '0')
         super().end_headers()
 
 if __name__ == "__main__":
@@ -0,0 +1,402 @@
+"""Regression checks for the pure pieces of api_server.py"""
+
+import contextlib
+import io
+import json
+import math
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import api_server  # noqa: E402
+
+
+class ServiceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+        (self.root / 'articles').mkdir()
+        (self.root / 'data').mkdir()
+        self.service = api_server.ArticleService(project_root=self.root)
+
+
+class SlugValidationTest(ServiceTestCase):
+    def test_generated_slug_is_accepted(self):
+        article = self.service.build_article_data({'title': 'Hello, World!', 'category': 'Data', 'content': '<p>x</p>'})
+        self.assertEqual(article['slug'], 'hello-world')
+
+    def test_existing_edge_dash_slug_is_accepted(self):
+        self.assertEqual(self.service.validate_slug('-the-diamond-rule-'), '-the-diamond-rule-')
+
+    def test_traversal_slug_is_rejected(self):
+        for slug in ('../../evil_out', 'a/b', '.', 'UPPER', 'with space'):
+            with self.subTest(slug=slug), self.assertRaises(ValueError):
+                self.service.build_article_data({'title': 'T', 'category': 'Data', 'content': 'c', 'slug': slug})
+
+    def test_reserved_slugs_are_rejected(self):
+        for title in ('Export', 'Bulk', 'Create'):
+            with self.subTest(title=title), self.assertRaises(ValueError):
+                self.service.build_article_data({'title': title, 'category': 'Data', 'content': 'c'})
+
+    def test_title_without_slug_characters_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.service.build_article_data({'title': '!!!', 'category': 'Data', 'content': 'c'})
+
+    def test_write_refuses_unvalidated_slug(self):
+        with self.assertRaises(ValueError):
+            self.service.write_article_files({'slug': '../evil'})
+        self.assertFalse((self.root / 'evil').exists())
+
+
+class CommentStoreTest(ServiceTestCase):
+    def setUp(self):
+        super().setUp()
+        self.article = self.service.build_article_data({'title': 'Commented', 'category': 'Data', 'content': 'c'})
+        self.service.write_article_files(self.article)
+        self.service.update_articles_json(self.article)
+        self.store = self.service.comment_store
+
+    def test_cursor_paging_walks_every_comment_once(self):
+        for i in range(7):
+            self.store.append('commented', 'reader', f'comment {i}')
+        seen, cursor, pages = [], 0, 0
+        while cursor is not None:
+            comments, cursor = self.store.page('commented', cursor, limit=3)
+            seen.extend(comment['content'] for comment in comments)
+            pages += 1
+        self.assertEqual(seen, [f'comment {i}' for i in range(7)])
+        self.assertEqual(pages, 3)
+
+    def test_cursor_inside_a_record_is_rejected(self):
+        self.store.append('commented', 'reader', 'hello')
+        with self.assertRaises(ValueError):
+            self.store.page('commented', cursor=5)
+
+    def test_damaged_record_is_skipped_not_a_cursor_error(self):
+        self.store.append('commented', 'reader', 'before')
+        log_path = self.root / 'articles' / 'commented' / api_server.COMMENTS_LOG_FILE
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write('{"content": "torn')
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.store.append('commented', 'reader', 'after')
+            comments, cursor = self.store.page('commented', 0, limit=10)
+        self.assertEqual([comment['content'] for comment in comments], ['before', 'after'])
+        self.assertIsNone(cursor)
+
+    def test_bare_list_comments_file_is_migrated(self):
+        article_dir = self.root / 'articles' / 'legacy'
+        article_dir.mkdir()
+        (article_dir / api_server.COMMENTS_HEADER_FILE).write_text('[{"id": "1", "content": "old"}]')
+        self.assertEqual(self.store.count('legacy'), 1)
+        self.assertEqual([comment['content'] for comment in self.store.page('legacy')[0]], ['old'])
+        header = json.loads((article_dir / api_server.COMMENTS_HEADER_FILE).read_text())
+        self.assertEqual(header['comments'], [])
+
+    def test_count_reaches_metadata_and_index(self):
+        self.store.append('commented', 'reader', 'first')
+        self.store.append('commented', 'reader', 'second')
+        self.service.sync_comment_count('commented')
+        metadata = json.loads((self.root / 'articles' / 'commented' / 'metadata.json').read_text())
+        index = json.loads((self.root / 'data' / 'articles.json').read_text())
+        self.assertEqual(metadata['stats']['comments'], 2)
+        self.assertEqual(index['articles'][0]['comments'], 2)
+
+
+class ImportLineNumberTest(ServiceTestCase):
+    def test_failures_report_source_line_numbers(self):
+        lines = ['\n', '{"title": "A"}\n', '\n', '\n', 'not json\n']
+        summary = self.service.import_articles(lines)
+        self.assertEqual([failure['line'] for failure in summary['failed']], [2, 5])
+
+
+class ListingPagesTest(ServiceTestCase):
+    def article(self, i, category='Data', tags=()):
+        return {'id': f'article-{i}', 'title': f'Article {i}', 'published': f'2024-01-{i:02d}T00:00:00',
+                'category': category, 'tags': list(tags)}
+
+    def test_pagination_and_groups(self):
+        articles = [self.article(i, tags=['AI'] if i % 2 else []) for i in range(1, 15)]
+        pages = self.service.listing_pages(articles)
+        size = api_server.LISTING_PAGE_SIZE
+        self.assertIn('', pages)
+        self.assertIn('page/3/', pages)
+        self.assertNotIn('page/4/', pages)
+        title, entries, page, total, list_path = pages['']
+        self.assertEqual((page, total, list_path), (1, 3, ''))
+        self.assertEqual([entry['id'] for entry in entries], [f'article-{i}' for i in range(14, 14 - size, -1)])
+        self.assertEqual(len(pages['page/3/'][1]), 14 - 2 * size)
+        self.assertEqual(pages['tag/ai/'][3], math.ceil(7 / size))
+        self.assertEqual(pages['category/data/'][0], 'Category: Data')
+
+    def test_empty_site_still_has_a_first_page(self):
+        self.assertEqual(self.service.listing_pages([])[''], ('All articles', [], 1, 1, ''))
+
+    def test_listings_do_not_share_the_article_namespace(self):
+        self.assertNotEqual(self.service.listing_dir.parent, self.service.articles_dir)
+        self.service.prerender_listings([self.article(1)])
+        self.assertTrue((self.root / api_server.LISTING_DIR_NAME / 'index.html').exists())
+        self.assertEqual(list(self.service.articles_dir.iterdir()), [])
+
+
+    def test_shrunken_lists_are_removed_even_when_forced(self):
+        listing_dir = self.root / api_server.LISTING_DIR_NAME
+        many = [self.article(i, tags=['AI']) for i in range(1, 15)]
+        self.service.prerender_listings(many)
+        self.assertTrue((listing_dir / 'page' / '3' / 'index.html').exists())
+        (listing_dir / api_server.LISTING_MANIFEST_FILE).unlink()  # e.g. lost or corrupted
+
+        self.service.prerender_listings(many[:2], force=True)
+        self.assertFalse((listing_dir / 'page' / '3' / 'index.html').exists())
+        self.assertFalse((listing_dir / 'tag' / 'ai' / 'page' / '2' / 'index.html').exists())
+        self.assertTrue((listing_dir / 'tag' / 'ai' / 'index.html').exists())
+        self.assertEqual([p.name for p in listing_dir.rglob('*.tmp')], [])
+
+    def test_sitemap_lists_listing_only_once_built(self):
+        listed = f'{api_server.SITE_URL}/{api_server.LISTING_DIR_NAME}/'
+        built = (api_server.PROJECT_ROOT / api_server.LISTING_DIR_NAME / 'index.html').exists()
+        self.assertEqual(listed in api_server.render_sitemap([]).decode('utf-8'), built)
+
+
+class RelatedIndexTest(unittest.TestCase):
+    TOPICS = {
+        'warehouse': 'warehouse schema modeling tables dimensions facts',
+        'streaming': 'streaming kafka events latency pipelines consumers',
+        'governance': 'governance policy stewardship ownership lineage audit',
+    }
+
+    def setUp(self):
+        try:
+            import numpy  # noqa: F401
+            import scipy  # noqa: F401
+        except ImportError:
+            self.skipTest('numpy/scipy not installed')
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+
+    def article(self, topic, i):
+        # Repeating a different number of topic words keeps every score distinct
+        words = self.TOPICS[topic].split()
+        content = f"{self.TOPICS[topic]} {' '.join(words[:i + 1])} note{i}"
+        return {'slug': f'{topic}-{i}', 'title': f'{topic} {i}', 'content': content,
+                'tags': [topic], 'category': 'Data'}
+
+    def documents(self, articles):
+        return [(a['slug'], a['title'], api_server.related_terms(a)) for a in articles]
+
+    def test_add_matches_full_build(self):
+        existing = [self.article(topic, i) for topic in self.TOPICS for i in range(4)]
+        new = self.article('streaming', 9)
+
+        incremental = api_server.RelatedIndex(self.dir / 'a', self.dir / 'a', k=3)
+        incremental.path.parent.mkdir()
+        incremental.build(self.documents(existing))
+        incremental.add(new)
+
+        full = api_server.RelatedIndex(self.dir / 'b', self.dir / 'b', k=3)
+        full.path.parent.mkdir()
+        full.build(self.documents(existing + [new]))
+
+        def neighbours(index):
+            return {item['id'] for item in index.related('streaming-9')}
+        self.assertEqual(neighbours(incremental), neighbours(full))
+        self.assertTrue(all(slug.startswith('streaming-') for slug in neighbours(incremental)))
+        self.assertIn('streaming-9', {item['id'] for item in incremental.related('streaming-0')})
+
+    def test_add_after_restart_uses_saved_model(self):
+        existing = [self.article(topic, i) for topic in self.TOPICS for i in range(4)]
+        api_server.RelatedIndex(self.dir, self.dir, k=3).build(self.documents(existing))
+
+        restarted = api_server.RelatedIndex(self.dir, self.dir, k=3)
+        restarted.build = lambda documents=None: self.fail('add() rebuilt the index')
+        restarted.add(self.article('governance', 9))
+        self.assertTrue(all(item['id'].startswith('governance-') for item in restarted.related('governance-9')))
+
+    def test_ties_are_broken_by_slug(self):
+        twins = [{'slug': slug, 'title': slug, 'content': 'kafka streaming events', 'tags': [], 'category': 'Data'}
+                 for slug in ('d', 'b', 'c', 'a')]
+        index = api_server.RelatedIndex(self.dir, self.dir, k=2)
+        index.build(self.documents(twins))
+        self.assertEqual([item['id'] for item in index.related('d')], ['a', 'b'])
+        self.assertEqual([item['id'] for item in index.related('a')], ['b', 'c'])
+
+    def test_recreated_slug_replaces_its_row(self):
+        existing = [self.article(topic, i) for topic in self.TOPICS for i in range(4)]
+        index = api_server.RelatedIndex(self.dir, self.dir, k=3)
+        index.build(self.documents(existing))
+        index.build = lambda documents=None: self.fail('add() rebuilt the index')
+
+        moved = dict(self.article('governance', 9), slug='streaming-0')
+        index.add(moved)
+        self.assertTrue(all(item['id'].startswith('governance-') for item in index.related('streaming-0')))
+        self.assertEqual(index.related('streaming-1')[-1]['id'], 'streaming-0')
+        self.assertIn('streaming-0', {item['id'] for item in index.related('governance-0')})
+
+    def test_service_indexes_its_own_tree(self):
+        service = api_server.ArticleService(project_root=self.dir)
+        self.assertEqual(service.related_index.path, self.dir / 'data' / api_server.RELATED_INDEX_FILE)
+        self.assertIsNot(service.related_index, api_server.related_index)
+
+
+class NewsletterStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.data_dir = Path(self.tmp.name) / 'data'
+        self.store = api_server.NewsletterStore(self.data_dir)
+        self.addCleanup(self.store.close)
+
+    def test_duplicate_emails_are_normalized_and_rejected(self):
+        self.data_dir.mkdir()
+        _, created = self.store.subscribe('Reader@Example.com')
+        _, again = self.store.subscribe('  reader@example.COM ')
+        self.assertTrue(created)
+        self.assertFalse(again)
+        self.assertEqual(self.store.stats()['totalSubscribers'], 1)
+
+    def test_dedup_survives_reload(self):
+        self.data_dir.mkdir()
+        self.store.subscribe('reader@example.com')
+        self.store.close()
+        reloaded = api_server.NewsletterStore(self.data_dir)
+        _, created = reloaded.subscribe('READER@example.com')
+        self.assertFalse(created)
+
+    def test_failed_flush_requeues_batch(self):
+        self.store.subscribe('first@example.com')
+        self.assertFalse(self.store.flush())  # data dir does not exist yet
+        self.data_dir.mkdir()
+        self.store.subscribe('second@example.com')
+        self.assertTrue(self.store.flush())
+        log = (self.data_dir / api_server.NEWSLETTER_LOG_FILE).read_text().splitlines()
+        self.assertEqual([json.loads(line)['email'] for line in log], ['first@example.com', 'second@example.com'])
+
+    def test_torn_last_line_is_skipped_and_terminated(self):
+        self.data_dir.mkdir()
+        log_path = self.data_dir / api_server.NEWSLETTER_LOG_FILE
+        log_path.write_text('{"email": "kept@example.com"}\n{"email": "x@y')
+        with contextlib.redirect_stderr(io.StringIO()):
+            _, created = self.store.subscribe('kept@example.com')
+            self.assertFalse(created)
+            self.store.subscribe('next@example.com')
+            self.assertTrue(self.store.flush())
+        lines = log_path.read_text().splitlines()
+        self.assertEqual(lines[1], '{"email": "x@y')
+        self.assertEqual(json.loads(lines[2])['email'], 'next@example.com')
+
+
+class FeedCacheTest(ServiceTestCase):
+    def setUp(self):
+        super().setUp()
+        self.article = self.service.build_article_data({'title': 'Feed me', 'category': 'Data', 'content': 'c'})
+        self.service.update_articles_json(self.article)
+        self.cached = self.service.feed_cache.get('feed.xml')
+
+    def test_stat_bump_keeps_cached_feed(self):
+        self.article['stats']['likes'] += 1
+        self.service.update_articles_json(self.article)
+        self.assertIs(self.service.feed_cache.get('feed.xml'), self.cached)
+
+    def test_title_or_published_change_clears_cached_feed(self):
+        for field, value in (('title', 'Fed'), ('published', '2020-01-01T00:00:00')):
+            with self.subTest(field=field):
+                self.article[field] = value
+                self.service.update_articles_json(self.article)
+                fresh = self.service.feed_cache.get('feed.xml')
+                self.assertIsNot(fresh, self.cached)
+                self.assertNotEqual(fresh[1], self.cached[1])
+                self.cached = fresh
+
+    def test_if_none_match_parsing(self):
+        etag = '"abc"'
+        self.assertTrue(api_server.etag_matches('"abc"', etag))
+        self.assertTrue(api_server.etag_matches('"xyz", "abc"', etag))
+        self.assertTrue(api_server.etag_matches('W/"abc"', etag))
+        self.assertTrue(api_server.etag_matches('*', etag))
+        self.assertFalse(api_server.etag_matches('"xyz"', etag))
+        self.assertFalse(api_server.etag_matches(None, etag))
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_burst_then_refill(self):
+        bucket = api_server.TokenBucket(rate=2, capacity=3, now=0)
+        self.assertEqual([bucket.take(0) for _ in range(3)], [0, 0, 0])
+        self.assertAlmostEqual(bucket.take(0), 0.5)
+        self.assertEqual(bucket.take(0.5), 0)
+
+    def test_refill_is_capped_at_capacity(self):
+        bucket = api_server.TokenBucket(rate=10, capacity=2, now=0)
+        bucket.take(100)
+        bucket.take(100)
+        self.assertGreater(bucket.take(100), 0)
+
+
+class AdmissionControllerTest(unittest.TestCase):
+    def test_global_bucket_survives_per_client_eviction(self):
+        limits = {'read': {'per_client': (100, 100), 'global': (0.001, 2)}}
+        controller = api_server.AdmissionController(limits=limits, max_buckets=2)
+        statuses = []
+        for i in range(5):
+            status, _ = controller.admit(f'10.0.0.{i}', 'GET', '/api/articles')
+            statuses.append(status)
+            controller.release()
+        self.assertEqual(statuses, [200, 200, 429, 429, 429])
+        self.assertGreater(controller.counters['evictedBuckets'], 0)
+
+
+class LogEventTest(unittest.TestCase):
+    def test_events_go_to_stderr_without_a_writer(self):
+        self.assertFalse(api_server.access_log.running)
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            api_server.log_event('Bulk import', level='warning', imported=3)
+        self.assertEqual(stderr.getvalue(), '[warning] Bulk import imported=3\n')
+        self.assertEqual(api_server.access_log.snapshot()['buffered'], 0)
+
+
+class AtomicWriteTest(unittest.TestCase):
+    def test_write_json_atomic_leaves_no_temp_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'articles.json'
+            api_server.write_json_atomic(path, {'articles': []})
+            api_server.write_json_atomic(path, {'articles': [1]})
+            self.assertEqual([p.name for p in Path(tmp).iterdir()], ['articles.json'])
+
+
+class BuildAssetsTest(unittest.TestCase):
+    def test_superseded_fingerprints_are_kept(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            assets_dir = Path(tmp) / 'assets'
+            dist_dir = assets_dir / 'dist'
+            (assets_dir / 'css').mkdir(parents=True)
+            (assets_dir / 'js').mkdir()
+            source = assets_dir / 'css' / 'main.css'
+            source.write_text('body { color: red; }\n')
+            first = api_server.build_assets(assets_dir=assets_dir, dist_dir=dist_dir)
+            source.write_text('body { color: blue; }\n')
+            second = api_server.build_assets(assets_dir=assets_dir, dist_dir=dist_dir)
+            old, new = first['files']['css/main.css'], second['files']['css/main.css']
+            self.assertNotEqual(old, new)
+            self.assertTrue((dist_dir / old).exists())
+            self.assertTrue((dist_dir / new).exists())
+
+    def test_truncated_fingerprint_is_rewritten(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            assets_dir = Path(tmp) / 'assets'
+            dist_dir = assets_dir / 'dist'
+            (assets_dir / 'css').mkdir(parents=True)
+            (assets_dir / 'js').mkdir()
+            (assets_dir / 'css' / 'main.css').write_text('body { color: red; }\n')
+            name = api_server.build_assets(assets_dir=assets_dir, dist_dir=dist_dir)['files']['css/main.css']
+            (dist_dir / name).write_text('body {')  # an interrupted write
+            api_server.build_assets(assets_dir=assets_dir, dist_dir=dist_dir)
+            self.assertEqual((dist_dir / name).read_text(), 'body { color: red; }\n')
+            self.assertEqual(list(dist_dir.rglob('*.tmp')), [])
+
+
+if __name__ == '__main__':
+    unittest.main()